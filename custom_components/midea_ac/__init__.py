@@ -1,7 +1,10 @@
 """Integration for Midea Smart AC."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import time
 
 import yaml
 from homeassistant.config_entries import ConfigEntry
@@ -16,14 +19,24 @@ from msmart.device import AirConditioner as AC
 from msmart.device import CommercialAirConditioner as CC
 from msmart.lan import AuthenticationError
 
-from .const import (CONF_ADDITIONAL_OPERATION_MODES, CONF_CAPABILITY_OVERRIDES,
-                    CONF_DEVICE_TYPE, CONF_ENERGY_DATA_FORMAT,
-                    CONF_ENERGY_DATA_SCALE, CONF_ENERGY_SENSOR, CONF_KEY,
+from .capability_cache import MideaCapabilityCache, get_capability_cache
+from .connection import (MideaEndpoint, get_connection_manager,
+                         set_connection_lifetime)
+from .const import (AUTHENTICATE_TIMEOUT, CAPABILITIES_RETRY_ATTEMPTS,
+                    CAPABILITIES_RETRY_INTERVAL, CAPABILITIES_REVALIDATE_DELAY,
+                    CAPABILITIES_TIMEOUT, CONF_ADAPTIVE_POLLING,
+                    CONF_ADDITIONAL_OPERATION_MODES, CONF_BEEP,
+                    CONF_CAPABILITY_OVERRIDES, CONF_DEVICE_TYPE,
+                    CONF_ENERGY_DATA_FORMAT, CONF_ENERGY_DATA_SCALE,
+                    CONF_ENERGY_SENSOR, CONF_FAN_SPEED_STEP, CONF_KEY,
                     CONF_MAX_CONNECTION_LIFETIME,
-                    CONF_MERGE_CAPABILITY_OVERRIDES, CONF_POWER_SENSOR,
-                    CONF_SHOW_ALL_PRESETS, CONF_UPDATE_INTERVAL,
-                    CONF_USE_FAN_ONLY_WORKAROUND, CONF_WORKAROUNDS, DOMAIN,
-                    UPDATE_INTERVAL, EnergyFormat)
+                    CONF_MERGE_CAPABILITY_OVERRIDES, CONF_OPTIMISTIC_STATE,
+                    CONF_POWER_SENSOR, CONF_SHOW_ALL_PRESETS, CONF_TEMP_STEP,
+                    CONF_UPDATE_INTERVAL, CONF_USE_FAN_ONLY_WORKAROUND,
+                    CONF_WORKAROUNDS, DATA_APPLIED_CONFIG,
+                    DATA_STARTUP_SEMAPHORE, DOMAIN, FIRST_REFRESH_TIMEOUT,
+                    STARTUP_CONCURRENCY, UPDATE_INTERVAL, EnergyFormat,
+                    TimingMetric)
 from .coordinator import MideaDeviceUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,6 +51,108 @@ _PLATFORMS = [
     Platform.SWITCH
 ]
 
+# Options applied to a loaded entry without a reload. Others may change the set of entities
+_LIVE_OPTIONS = frozenset({
+    CONF_UPDATE_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_OPTIMISTIC_STATE,
+    CONF_MAX_CONNECTION_LIFETIME,
+    CONF_BEEP,
+    CONF_TEMP_STEP,
+    CONF_FAN_SPEED_STEP,
+    CONF_ENERGY_SENSOR,
+    CONF_POWER_SENSOR,
+})
+
+
+def _get_startup_semaphore(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent device connections during startup."""
+    if (semaphore := hass.data.get(DATA_STARTUP_SEMAPHORE)) is None:
+        semaphore = hass.data[DATA_STARTUP_SEMAPHORE] = asyncio.Semaphore(
+            STARTUP_CONCURRENCY)
+
+    return semaphore
+
+
+async def _async_get_capabilities(device: AC | CC, endpoint: MideaEndpoint) -> bool:
+    """Query device capabilities. Return False if the query timed out or the device didn't respond."""
+    _LOGGER.info("Querying capabilities for device ID %s.", device.id)
+    try:
+        async with endpoint, asyncio.timeout(CAPABILITIES_TIMEOUT):
+            await device.get_capabilities()
+    except TimeoutError:
+        return False
+
+    return device.online
+
+
+def _apply_capability_overrides(config_entry: ConfigEntry, device: AC | CC) -> None:
+    """Apply capability overrides from the config entry if present."""
+    if (yaml_input := config_entry.options.get(CONF_CAPABILITY_OVERRIDES)):
+        try:
+            overrides = yaml.safe_load(yaml_input)
+            merge = config_entry.options.get(
+                CONF_MERGE_CAPABILITY_OVERRIDES, True)
+            _LOGGER.info(
+                "Applying capability overrides (merge: %s) for device ID %s: %s", merge, device.id,  overrides)
+            device.override_capabilities(overrides, merge=merge)
+        except (yaml.YAMLError, ValueError) as e:
+            _LOGGER.error(
+                "Failed to apply capability overrides for device ID %s: %s", device.id, e)
+
+
+async def _async_query_capabilities(coordinator: MideaDeviceUpdateCoordinator) -> bool:
+    """Query device capabilities via the coordinator. Return False on timeout or no response."""
+    try:
+        async with asyncio.timeout(CAPABILITIES_TIMEOUT):
+            return await coordinator.async_get_capabilities()
+    except TimeoutError:
+        return False
+
+
+async def _async_retry_capabilities(hass: HomeAssistant, config_entry: ConfigEntry,
+                                    coordinator: MideaDeviceUpdateCoordinator,
+                                    cache: MideaCapabilityCache) -> None:
+    """Retry capability discovery in the background and reload the entry on success."""
+    interval = CAPABILITIES_RETRY_INTERVAL
+    for _ in range(CAPABILITIES_RETRY_ATTEMPTS):
+        await asyncio.sleep(interval)
+
+        if await _async_query_capabilities(coordinator):
+            cache.async_update(coordinator.device)
+            # Reload so entities are created from the discovered capabilities
+            _LOGGER.info(
+                "Discovered capabilities for device ID %s. Reloading.", coordinator.device.id)
+            hass.config_entries.async_schedule_reload(config_entry.entry_id)
+            return
+
+        interval *= 2
+
+    _LOGGER.warning(
+        "Failed to discover capabilities for device ID %s. Using default capabilities.", coordinator.device.id)
+
+
+async def _async_revalidate_capabilities(hass: HomeAssistant, config_entry: ConfigEntry,
+                                         coordinator: MideaDeviceUpdateCoordinator,
+                                         cache: MideaCapabilityCache) -> None:
+    """Revalidate cached capabilities in the background and reload the entry if they changed."""
+    # Randomize the delay to avoid querying every device at once after a restart
+    await asyncio.sleep(CAPABILITIES_REVALIDATE_DELAY * random.uniform(1, 2))
+
+    if not await _async_query_capabilities(coordinator):
+        _LOGGER.debug(
+            "Failed to revalidate capabilities for device ID %s.", coordinator.device.id)
+        return
+
+    if cache.async_update(coordinator.device):
+        _LOGGER.info(
+            "Capabilities changed for device ID %s. Reloading.", coordinator.device.id)
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+    # Querying replaced the device's capabilities so reapply any overrides
+    _apply_capability_overrides(config_entry, coordinator.device)
+
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Setup Midea Smart AC device from a config entry."""
@@ -53,70 +168,148 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     _LOGGER.info("Starting midea-ac-py for device type %02X ID %s (%s:%d). Using msmart-ng version %s.",
                  device_type, id, host, port, MSMART_VERSION)
 
-    # Construct the device
-    device = Device.construct(
-        type=device_type,
-        ip=host,
-        port=port,
-        device_id=int(id)
-    )
+    connections = get_connection_manager(hass)
+
+    # Reuse the authenticated session of a reloaded entry, otherwise construct the device
+    if (device := connections.claim_session(
+            config_entry.entry_id, _session_credentials(config_entry))) is not None:
+        _LOGGER.info("Reusing existing session for device ID %s.", device.id)
+        authenticated = True
+    else:
+        device = Device.construct(
+            type=device_type,
+            ip=host,
+            port=port,
+            device_id=int(id)
+        )
+        authenticated = False
     assert isinstance(device, (AC, CC))
 
-    # Configure the connection lifetime
-    if (lifetime := config_entry.options.get(CONF_MAX_CONNECTION_LIFETIME)) is not None:
+    # Configure the connection lifetime, replacing a reused connection of a different lifetime
+    lifetime = config_entry.options.get(CONF_MAX_CONNECTION_LIFETIME)
+    if lifetime is not None:
         _LOGGER.info(
             "Setting maximum connection lifetime to %s seconds for device ID %s.", lifetime, device.id)
-        device.set_max_connection_lifetime(lifetime)
+    set_connection_lifetime(device, lifetime)
 
-    # Configure token and k1 as needed
-    token = config_entry.data[CONF_TOKEN]
-    key = config_entry.data[CONF_KEY]
-    if token and key:
-        try:
-            await device.authenticate(token, key)
-        except AuthenticationError as e:
-            raise ConfigEntryNotReady(
-                "Failed to authenticate with device.") from e
-
-    # Query device capabilities
-    _LOGGER.info("Querying capabilities for device ID %s.", device.id)
-    await device.get_capabilities()
-
-    # Apply capability overrides if present
-    if (yaml_input := config_entry.options.get(CONF_CAPABILITY_OVERRIDES)):
-        try:
-            overrides = yaml.safe_load(yaml_input)
-            merge = config_entry.options.get(
-                CONF_MERGE_CAPABILITY_OVERRIDES, True)
-            _LOGGER.info(
-                "Applying capability overrides (merge: %s) for device ID %s: %s", merge, device.id,  overrides)
-            device.override_capabilities(overrides, merge=merge)
-        except (yaml.YAMLError, ValueError) as e:
-            _LOGGER.error(
-                "Failed to apply capability overrides for device ID %s: %s", device.id, e)
+    # Serialize requests with other devices at the same host and port
+    endpoint = connections.acquire(host, port, config_entry.entry_id)
 
-    # Create device coordinator and fetch data
-    poll_interval = config_entry.options.get(
-        CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)
-    _LOGGER.info(
-        "Using update interval of %d seconds for device ID %s.", poll_interval, device.id)
-    coordinator = MideaDeviceUpdateCoordinator(
-        hass, device, update_interval=poll_interval)  # type: ignore
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        coordinator = await _async_setup_device(
+            hass, config_entry, device, endpoint, authenticated)
+    except BaseException:
+        connections.release(host, port, config_entry.entry_id)
+        raise
 
     # Store coordinator in global data
     hass.data[DOMAIN][config_entry.entry_id] = coordinator
 
+    # Remember the configuration the entry was setup with to detect what changes
+    hass.data.setdefault(DATA_APPLIED_CONFIG, {})[config_entry.entry_id] = (
+        dict(config_entry.data), dict(config_entry.options))
+
     # Forward setup to all platforms
     await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
 
-    # Reload entry when its updated
+    # Apply changes when the entry is updated
     config_entry.async_on_unload(
-        config_entry.add_update_listener(async_reload_entry))
+        config_entry.add_update_listener(async_entry_updated))
 
     return True
 
 
+def _session_credentials(config_entry: ConfigEntry) -> tuple:
+    """Return the config entry data a device session depends on."""
+    data = config_entry.data
+    return (data[CONF_DEVICE_TYPE], data[CONF_HOST], data[CONF_PORT],
+            data[CONF_ID], data[CONF_TOKEN], data[CONF_KEY])
+
+
+async def _async_setup_device(hass: HomeAssistant, config_entry: ConfigEntry,
+                              device: AC | CC, endpoint: MideaEndpoint,
+                              authenticated: bool = False) -> MideaDeviceUpdateCoordinator:
+    """Authenticate, query capabilities and create a coordinator for a device."""
+
+    # Restore capabilities from the cache if valid, otherwise query the device
+    cache = get_capability_cache(hass)
+    await cache.async_load()
+
+    # Limit the number of devices connecting concurrently. The first refresh
+    # happens after release so a slow device doesn't hold up others
+    async with _get_startup_semaphore(hass):
+        # Configure token and k1 as needed
+        token = config_entry.data[CONF_TOKEN]
+        key = config_entry.data[CONF_KEY]
+        authenticate_time = None
+        if token and key and not authenticated:
+            start = time.perf_counter()
+            try:
+                # Avoid concurrent handshakes with the same host
+                async with endpoint, asyncio.timeout(AUTHENTICATE_TIMEOUT):
+                    await device.authenticate(token, key)
+            except (AuthenticationError, TimeoutError) as e:
+                raise ConfigEntryNotReady(
+                    "Failed to authenticate with device.") from e
+            authenticate_time = time.perf_counter() - start
+
+        # Defer capabilities to the background if the device doesn't respond
+        capabilities_deferred = False
+        if capabilities_cached := cache.restore(device):
+            _LOGGER.info(
+                "Using cached capabilities for device ID %s.", device.id)
+        elif await _async_get_capabilities(device, endpoint):
+            cache.async_update(device)
+        else:
+            capabilities_deferred = True
+            _LOGGER.warning(
+                "Failed to query capabilities for device ID %s. Retrying in background.", device.id)
+
+    _apply_capability_overrides(config_entry, device)
+
+    # Create device coordinator and fetch data
+    poll_interval = config_entry.options.get(
+        CONF_UPDATE_INTERVAL, UPDATE_INTERVAL)
+    adaptive_polling = config_entry.options.get(CONF_ADAPTIVE_POLLING, False)
+    optimistic_state = config_entry.options.get(CONF_OPTIMISTIC_STATE, False)
+    _LOGGER.info(
+        "Using update interval of %d seconds (adaptive: %s) for device ID %s.", poll_interval, adaptive_polling, device.id)
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass, device, update_interval=poll_interval, adaptive=adaptive_polling,
+        optimistic=optimistic_state, endpoint=endpoint)  # type: ignore
+
+    # Record the authentication of this setup
+    if authenticate_time is not None:
+        coordinator.timings.record(
+            TimingMetric.AUTHENTICATE, authenticate_time)
+
+    if capabilities_deferred:
+        # Skip the first refresh of an unresponsive device, the scheduled polls will pick it up
+        config_entry.async_create_background_task(
+            hass,
+            _async_retry_capabilities(hass, config_entry, coordinator, cache),
+            name=f"{DOMAIN} {device.id} capabilities",
+        )
+        return coordinator
+
+    if capabilities_cached:
+        config_entry.async_create_background_task(
+            hass,
+            _async_revalidate_capabilities(
+                hass, config_entry, coordinator, cache),
+            name=f"{DOMAIN} {device.id} capabilities",
+        )
+
+    try:
+        async with asyncio.timeout(FIRST_REFRESH_TIMEOUT):
+            await coordinator.async_config_entry_first_refresh()
+    except TimeoutError:
+        _LOGGER.warning(
+            "Timed out fetching initial state for device ID %s.", device.id)
+
+    return coordinator
+
+
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate config entry."""
 
@@ -232,11 +425,72 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
 
     if unload_ok:
         # Remove the coordinator from global data
-        hass.data[DOMAIN].pop(config_entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(config_entry.entry_id)
+        hass.data[DATA_APPLIED_CONFIG].pop(config_entry.entry_id, None)
+
+        # Leave the shared endpoint
+        connections = get_connection_manager(hass)
+        connections.release(
+            config_entry.data[CONF_HOST], config_entry.data[CONF_PORT], config_entry.entry_id)
+
+        # Keep the device session in case the entry is being reloaded
+        connections.park_session(config_entry.entry_id,
+                                 _session_credentials(config_entry), coordinator.device._device)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Handle removal of a config entry."""
+    # Close the session of the removed device
+    get_connection_manager(hass).discard_session(config_entry.entry_id)
+
+    # Discard the cached capabilities of the device
+    cache = get_capability_cache(hass)
+    await cache.async_load()
+    cache.async_remove(config_entry.data[CONF_ID])
+
+
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload a config entry."""
     await hass.config_entries.async_reload(config_entry.entry_id)
+
+
+async def async_entry_updated(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Apply changed options in place, reloading the entry if the entities may change."""
+    data, options = hass.data[DATA_APPLIED_CONFIG][config_entry.entry_id]
+
+    changed = {key for key in options.keys() | config_entry.options.keys()
+               if options.get(key) != config_entry.options.get(key)}
+    if config_entry.data != data or changed - _LIVE_OPTIONS:
+        await async_reload_entry(hass, config_entry)
+        return
+
+    if not changed:
+        return
+
+    _LOGGER.info("Applying changed options %s without reload for device ID %s.",
+                 sorted(changed), config_entry.data[CONF_ID])
+
+    coordinator: MideaDeviceUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    device = coordinator.device
+    options = config_entry.options
+
+    coordinator.async_set_polling(
+        options.get(CONF_UPDATE_INTERVAL, UPDATE_INTERVAL),
+        adaptive=options.get(CONF_ADAPTIVE_POLLING, False),
+        optimistic=options.get(CONF_OPTIMISTIC_STATE, False))
+
+    # Replaces the connection if the lifetime changed
+    await coordinator.async_set_connection_lifetime(
+        options.get(CONF_MAX_CONNECTION_LIFETIME))
+
+    # Staged like the climate entity does so it's sent with the next command
+    if hasattr(device, "beep"):
+        device.beep = options.get(CONF_BEEP, False)
+
+    # Update entities that depend on options
+    coordinator.async_update_options(options)
+
+    hass.data[DATA_APPLIED_CONFIG][config_entry.entry_id] = (
+        data, dict(options))
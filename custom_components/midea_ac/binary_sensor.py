@@ -77,6 +77,7 @@ class MideaBinarySensor(MideaCoordinatorEntity, BinarySensorEntity):
         MideaCoordinatorEntity.__init__(self, coordinator)
 
         self._prop = prop
+        self._dependencies = frozenset({prop})
         self._device_class = device_class
         self._entity_category = entity_category
         self._attr_translation_key = translation_key
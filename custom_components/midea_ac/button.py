@@ -42,6 +42,9 @@ async def async_setup_entry(
 class MideaButton(MideaCoordinatorEntity, ButtonEntity):
     """Button for Midea AC."""
 
+    # Buttons have no state, only availability
+    _dependencies = frozenset()
+
     def __init__(self,
                  coordinator: MideaDeviceUpdateCoordinator,
                  method: str,
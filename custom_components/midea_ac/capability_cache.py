@@ -0,0 +1,111 @@
+"""Persistent device capability cache for Midea Smart AC."""
+
+import logging
+from asyncio import Lock
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from msmart import __version__ as MSMART_VERSION
+
+from .const import DATA_CAPABILITY_CACHE, DOMAIN, MideaDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+_STORAGE_KEY = f"{DOMAIN}.capabilities"
+_STORAGE_VERSION = 1
+_SAVE_DELAY = 10
+
+# Device state set by a capability query that isn't part of the serialized capabilities
+_CAPABILITY_STATE = ("_ieco_number",)
+
+
+def _capability_state(device: MideaDevice) -> dict[str, Any]:
+    """Return the state of a device set by a capability query."""
+    return {name: getattr(device, name) for name in _CAPABILITY_STATE if hasattr(device, name)}
+
+
+class MideaCapabilityCache:
+    """Cache of device capabilities persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store[dict[str, Any]](
+            hass, _STORAGE_VERSION, _STORAGE_KEY)
+        self._lock = Lock()
+        self._data: dict[str, Any] | None = None
+
+    async def async_load(self) -> None:
+        """Load the cache from storage if not yet loaded."""
+        async with self._lock:
+            if self._data is None:
+                self._data = await self._store.async_load() or {}
+
+    @staticmethod
+    def _fingerprint(device: MideaDevice) -> str:
+        """Return a fingerprint identifying the device and library that produced the capabilities."""
+        # Firmware isn't exposed by the device, so use the protocol version and library version
+        return f"{device.type:X}-{device.version}-{MSMART_VERSION}"
+
+    def get(self, device: MideaDevice) -> dict[str, Any] | None:
+        """Return the cached capabilities of a device if still valid."""
+        assert self._data is not None, "Cache not loaded."
+
+        entry = self._data.get(str(device.id))
+        if entry is None or entry.get("fingerprint") != self._fingerprint(device):
+            return None
+
+        return entry
+
+    def restore(self, device: MideaDevice) -> bool:
+        """Restore cached capabilities to a device. Return True on success."""
+        if (entry := self.get(device)) is None:
+            return False
+
+        # Query the device again if an older entry lacks any state
+        state = entry.get("state", {})
+        if state.keys() != _capability_state(device).keys():
+            _LOGGER.debug(
+                "Cached capabilities for device ID %s are incomplete.", device.id)
+            return False
+
+        try:
+            device.override_capabilities(entry["capabilities"], merge=False)
+        except (KeyError, ValueError) as e:
+            _LOGGER.warning(
+                "Discarding invalid cached capabilities for device ID %s: %s", device.id, e)
+            return False
+
+        for name, value in state.items():
+            setattr(device, name, value)
+
+        return True
+
+    @callback
+    def async_update(self, device: MideaDevice) -> bool:
+        """Cache the current capabilities of a device. Return True if they changed."""
+        assert self._data is not None, "Cache not loaded."
+
+        entry = {
+            "fingerprint": self._fingerprint(device),
+            "capabilities": device.serialize_capabilities(),
+            "state": _capability_state(device),
+        }
+
+        key = str(device.id)
+        changed = self._data.get(key) != entry
+        if changed:
+            self._data[key] = entry
+            self._store.async_delay_save(lambda: self._data, _SAVE_DELAY)
+
+        return changed
+
+    @callback
+    def async_remove(self, device_id: str) -> None:
+        """Remove a device from the cache."""
+        if self._data is not None and self._data.pop(str(device_id), None) is not None:
+            self._store.async_delay_save(lambda: self._data, _SAVE_DELAY)
+
+
+def get_capability_cache(hass: HomeAssistant) -> MideaCapabilityCache:
+    """Get the integration wide capability cache."""
+    return hass.data.setdefault(DATA_CAPABILITY_CACHE, MideaCapabilityCache(hass))
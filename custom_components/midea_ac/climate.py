@@ -16,7 +16,7 @@ from homeassistant.components.climate.const import (ATTR_HVAC_MODE,
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (ATTR_TEMPERATURE, CONF_ENABLED,
                                  UnitOfTemperature)
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -84,10 +84,22 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
 
     _attr_translation_key = DOMAIN
     _enable_turn_on_off_backwards_compatibility = False
+    _dependencies = frozenset({
+        "indoor_temperature",
+        "target_temperature",
+        "indoor_humidity",
+        "target_humidity",
+        "swing_mode",
+        "fan_speed",
+        "power_state",
+        "operational_mode",
+    })
 
     _OPERATIONAL_MODE_TO_HVAC_MODE: ClassVar[Mapping[Any, HVACMode]]
     _HVAC_MODE_TO_OPERATIONAL_MODE: ClassVar[Mapping[HVACMode, Any]]
 
+    _follows_options = True
+
     def __init__(self,
                  hass: HomeAssistant,
                  coordinator: MideaDeviceUpdateCoordinator[MideaDevice],
@@ -151,6 +163,12 @@ class MideaClimateDevice(MideaCoordinatorEntity[MideaDevice], ClimateEntity, Gen
         _LOGGER.debug("Target temperature step: %f, min: %f, max: %f.",
                       self._target_temperature_step, self._min_temperature, self._max_temperature)
 
+    @callback
+    def _handle_options_update(self, options: Mapping[str, Any]) -> None:
+        """Update the temperature step from changed options."""
+        self._target_temperature_step = options.get(CONF_TEMP_STEP, 1.0)
+        self.async_write_ha_state()
+
     async def _apply(self) -> None:
         """Apply changes to the device."""
         # Apply via the coordinator
@@ -339,6 +357,16 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
 
     _FAN_CUSTOM = "custom"
 
+    _dependencies = MideaClimateDevice._dependencies | {
+        "eco",
+        "ieco",
+        "turbo",
+        "freeze_protection",
+        "sleep",
+        "follow_me",
+        "error_code",
+    }
+
     # Dictionaries to convert from Midea mode to HA mode
     _OPERATIONAL_MODE_TO_HVAC_MODE: ClassVar[Mapping[AC.OperationalMode, HVACMode]] = {
         AC.OperationalMode.AUTO: HVACMode.AUTO,
@@ -407,11 +435,6 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
         """Assume state rather than refresh to workaround fan_only bug."""
         return self._use_fan_only_workaround
 
-    @property
-    def should_poll(self) -> bool:
-        """Poll the appliance for changes, there is no notification capability in the Midea API"""
-        return not self._use_fan_only_workaround
-
     @property
     def extra_state_attributes(self) -> dict[str, str]:
         """Return device specific state attributes."""
@@ -559,14 +582,18 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
-        self._device.eco = preset_mode == PRESET_ECO
-        self._device.turbo = preset_mode == PRESET_BOOST
-        self._device.freeze_protection = preset_mode == PRESET_AWAY
-        self._device.sleep = preset_mode == PRESET_SLEEP
+        changes = {
+            "eco": preset_mode == PRESET_ECO,
+            "turbo": preset_mode == PRESET_BOOST,
+            "freeze_protection": preset_mode == PRESET_AWAY,
+            "sleep": preset_mode == PRESET_SLEEP,
+        }
 
         # Update iECO mode only if supported to avoid generating a SetProperties command
         if self._device.supports_ieco:
-            self._device.ieco = preset_mode == PRESET_IECO
+            changes["ieco"] = preset_mode == PRESET_IECO
+
+        self._device.stage(changes)
 
         await self._apply()
 
@@ -574,6 +601,12 @@ class MideaClimateACDevice(MideaClimateDevice[AC]):
 class MideaClimateCCDevice(MideaClimateDevice[CC]):
     """Climate entity for Midea CC device."""
 
+    _dependencies = MideaClimateDevice._dependencies | {
+        "eco",
+        "silent",
+        "sleep",
+    }
+
     # Dictionaries to convert from Midea mode to HA mode
     _OPERATIONAL_MODE_TO_HVAC_MODE: ClassVar[Mapping[CC.OperationalMode, HVACMode]] = {
         CC.OperationalMode.AUTO: HVACMode.AUTO,
@@ -647,8 +680,10 @@ class MideaClimateCCDevice(MideaClimateDevice[CC]):
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
         # Enable proper mode
-        self._device.eco = preset_mode == PRESET_ECO
-        self._device.silent = preset_mode == PRESET_SILENT
-        self._device.sleep = preset_mode == PRESET_SLEEP
+        self._device.stage({
+            "eco": preset_mode == PRESET_ECO,
+            "silent": preset_mode == PRESET_SILENT,
+            "sleep": preset_mode == PRESET_SLEEP,
+        })
 
         await self._apply()
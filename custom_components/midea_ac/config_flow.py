@@ -1,7 +1,10 @@
 """Config flow for Midea Smart AC."""
 from __future__ import annotations
 
+import asyncio
+import ipaddress
 import logging
+import re
 from typing import Any, cast
 
 import homeassistant.helpers.config_validation as cv
@@ -31,21 +34,25 @@ from msmart.device import CommercialAirConditioner as CC
 from msmart.discover import CloudError, Discover
 from msmart.lan import AuthenticationError
 
-from .const import (CONF_BEEP, CONF_CAPABILITY_OVERRIDES,
-                    CONF_CLOUD_COUNTRY_CODES, CONF_DEFAULT_CLOUD_COUNTRY,
-                    CONF_DEVICE_TYPE, CONF_ENERGY_DATA_FORMAT,
-                    CONF_ENERGY_DATA_SCALE, CONF_ENERGY_SENSOR,
-                    CONF_FAN_SPEED_STEP, CONF_KEY,
+from .const import (CONF_ADAPTIVE_POLLING, CONF_BEEP,
+                    CONF_CAPABILITY_OVERRIDES, CONF_CLOUD_COUNTRY_CODES,
+                    CONF_DEFAULT_CLOUD_COUNTRY, CONF_DEVICE_TYPE,
+                    CONF_ENERGY_DATA_FORMAT, CONF_ENERGY_DATA_SCALE,
+                    CONF_ENERGY_SENSOR, CONF_FAN_SPEED_STEP, CONF_KEY,
                     CONF_MAX_CONNECTION_LIFETIME,
-                    CONF_MERGE_CAPABILITY_OVERRIDES, CONF_POWER_SENSOR,
-                    CONF_SWING_ANGLE_RTL, CONF_TEMP_STEP, CONF_UPDATE_INTERVAL,
-                    CONF_USE_FAN_ONLY_WORKAROUND, CONF_WORKAROUNDS, DOMAIN,
-                    UPDATE_INTERVAL, EnergyFormat)
+                    CONF_MERGE_CAPABILITY_OVERRIDES, CONF_OPTIMISTIC_STATE,
+                    CONF_POWER_SENSOR, CONF_SWING_ANGLE_RTL, CONF_TEMP_STEP,
+                    CONF_UPDATE_INTERVAL, CONF_USE_FAN_ONLY_WORKAROUND,
+                    CONF_WORKAROUNDS, DISCOVERY_CONCURRENCY,
+                    DISCOVERY_MAX_TARGETS, DOMAIN, UPDATE_INTERVAL,
+                    EnergyFormat)
 
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_OPTIONS = {
     CONF_UPDATE_INTERVAL: UPDATE_INTERVAL,
+    CONF_ADAPTIVE_POLLING: False,
+    CONF_OPTIMISTIC_STATE: False,
     CONF_TEMP_STEP: 1.0,
     CONF_MAX_CONNECTION_LIFETIME: None,
     CONF_SWING_ANGLE_RTL: False,
@@ -70,6 +77,31 @@ _DEFAULT_AC_OPTIONS = {
 }
 
 
+def _parse_discovery_targets(value: str) -> list[str]:
+    """Parse a list of hosts and networks in CIDR notation into discovery targets.
+
+    Raises ValueError if a network is invalid or there are too many targets.
+    """
+    targets = []
+    for item in filter(None, re.split(r"[\s,]+", value)):
+        if "/" not in item:
+            targets.append(item)
+            continue
+
+        # Devices only answer unicast or local broadcasts, so expand networks to their hosts
+        network = ipaddress.ip_network(item, strict=False)
+        if network.num_addresses > DISCOVERY_MAX_TARGETS:
+            raise ValueError(f"Network {network} is too large.")
+
+        targets.extend(str(host) for host in network.hosts())
+
+    if len(targets) > DISCOVERY_MAX_TARGETS:
+        raise ValueError("Too many discovery targets.")
+
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(targets))
+
+
 class MideaConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow for Midea Smart AC."""
 
@@ -92,26 +124,31 @@ class MideaConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             country_code = cast(str, user_input.get(CONF_COUNTRY_CODE))
 
-            # If host was not provided, discover all devices
-            if not (host := user_input.get(CONF_HOST)):
-                return await self.async_step_pick_device(country_code=country_code)
-
-            # Attempt to find specified device
-            device = await Discover.discover_single(
-                host,
-                auto_connect=False,
-                timeout=2,
-                region=country_code,
-                get_async_client=self._get_async_client
-            )
-
-            if device is None:
-                errors["base"] = "device_not_found"
-            elif device.type not in [DeviceType.AIR_CONDITIONER, DeviceType.COMMERCIAL_AC]:
-                errors["base"] = "unsupported_device"
+            try:
+                targets = _parse_discovery_targets(
+                    user_input.get(CONF_HOST) or "")
+            except ValueError:
+                errors["base"] = "invalid_network"
             else:
-                # Attempt connection
-                return await self._attempt_auto_connection(device)
+                # If host was not provided discover all devices, or all devices
+                # at multiple hosts and networks
+                if len(targets) != 1:
+                    return await self.async_step_pick_device(country_code=country_code, targets=targets)
+
+                # Attempt to find specified device. The target may be a directed
+                # broadcast address, so let the user pick if several devices answer
+                devices = await self._async_discover(country_code, targets)
+                if len(devices) > 1:
+                    return await self.async_step_pick_device(devices=devices)
+
+                device = devices[0] if devices else None
+                if device is None:
+                    errors["base"] = "device_not_found"
+                elif device.type not in [DeviceType.AIR_CONDITIONER, DeviceType.COMMERCIAL_AC]:
+                    errors["base"] = "unsupported_device"
+                else:
+                    # Attempt connection
+                    return await self._attempt_auto_connection(device)
 
         data_schema = self.add_suggested_values_to_schema(
             vol.Schema({
@@ -133,7 +170,9 @@ class MideaConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_pick_device(
         self, user_input: dict[str, Any] | None = None,
         *,
-        country_code: str = CONF_DEFAULT_CLOUD_COUNTRY
+        country_code: str = CONF_DEFAULT_CLOUD_COUNTRY,
+        targets: list[str] | None = None,
+        devices: list[Device] | None = None
     ) -> ConfigFlowResult:
         """Handle the pick device step of config flow."""
 
@@ -154,13 +193,11 @@ class MideaConfigFlow(ConfigFlow, domain=DOMAIN):
             entry.unique_id for entry in self._async_current_entries()
         }
 
-        # Discover all devices
-        self._discovered_devices = await Discover.discover(
-            auto_connect=False,
-            timeout=2,
-            region=country_code,
-            get_async_client=self._get_async_client
-        )
+        # Discover all devices unless already discovered
+        if devices is None:
+            devices = await self._async_discover(country_code, targets)
+
+        self._discovered_devices = devices
 
         # Create a dict of supported devices
         supported_devices = {
@@ -358,6 +395,44 @@ class MideaConfigFlow(ConfigFlow, domain=DOMAIN):
             errors=errors
         )
 
+    async def _async_discover(self, country_code: str, targets: list[str] | None = None) -> list[Device]:
+        """Discover devices at each target concurrently, or via broadcast if no targets."""
+        kwargs = {
+            "auto_connect": False,
+            "timeout": 2,
+            "region": country_code,
+            "get_async_client": self._get_async_client
+        }
+
+        if not targets:
+            return await Discover.discover(**kwargs)
+
+        # Limit the number of sockets open at once when scanning networks
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+        async def _discover(target: str) -> list[Device]:
+            async with semaphore:
+                return await Discover.discover(target=target, **kwargs)
+
+        results = await asyncio.gather(
+            *(_discover(target) for target in targets),
+            return_exceptions=True
+        )
+
+        # Merge results, dropping devices reachable via multiple targets
+        devices: dict[int, Device] = {}
+        for target, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                # Don't let an unreachable target prevent discovery on the others
+                _LOGGER.warning(
+                    "Failed to discover devices at %s: %s", target, result)
+                continue
+
+            for device in result:
+                devices.setdefault(device.id, device)
+
+        return list(devices.values())
+
     def _get_async_client(self, *args, **kwargs) -> httpx.AsyncClient:
         """Create an httpx AsyncClient in a HA friendly way."""
         return httpx_client.get_async_client(self.hass, *args, **kwargs)
@@ -457,6 +532,8 @@ class MideaOptionsFlow(OptionsFlow):
                     mode=NumberSelectorMode.SLIDER,
                 )
             ),
+            vol.Optional(CONF_ADAPTIVE_POLLING): cv.boolean,
+            vol.Optional(CONF_OPTIMISTIC_STATE): cv.boolean,
             vol.Optional(CONF_SWING_ANGLE_RTL): cv.boolean,
             vol.Optional(CONF_TEMP_STEP): NumberSelector(
                 NumberSelectorConfig(
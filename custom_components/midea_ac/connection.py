@@ -0,0 +1,230 @@
+"""Shared connection state of devices behind the same host for Midea Smart AC."""
+
+import logging
+from asyncio import Lock
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Hashable
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from msmart.lan import LAN
+
+from .const import (CONNECTION_ROTATION_MARGIN, DATA_CONNECTION_MANAGER,
+                    SESSION_REUSE_TIMEOUT, MideaDevice)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MideaEndpoint:
+    """Devices reachable at the same host and port, such as units behind a gateway.
+
+    Gateways handle one request at a time, so requests of all member devices
+    are serialized in arrival order.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        self._host = host
+        self._port = port
+        self._lock = Lock()
+        self._members: set[str] = set()
+
+        # Number of requests that waited on another member
+        self._contended = 0
+
+    @property
+    def host(self) -> str:
+        """Return the host of the endpoint."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Return the port of the endpoint."""
+        return self._port
+
+    @property
+    def members(self) -> int:
+        """Return the number of member devices."""
+        return len(self._members)
+
+    def locked(self) -> bool:
+        """Return True if a request to the endpoint is in progress."""
+        return self._lock.locked()
+
+    async def acquire(self) -> None:
+        """Wait for the endpoint to be free."""
+        if self._lock.locked():
+            self._contended += 1
+
+        await self._lock.acquire()
+
+    def release(self) -> None:
+        """Release the endpoint to the next waiting request."""
+        self._lock.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *args) -> None:
+        self.release()
+
+    def join(self, key: str) -> None:
+        """Add a member device."""
+        self._members.add(key)
+
+    def leave(self, key: str) -> None:
+        """Remove a member device."""
+        self._members.discard(key)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state of the endpoint."""
+        return {
+            "members": len(self._members),
+            "contended": self._contended,
+        }
+
+
+@dataclass
+class _ParkedSession:
+    credentials: Hashable
+    device: MideaDevice
+    cancel: CALLBACK_TYPE
+
+
+class MideaConnectionManager:
+    """Integration wide registry of endpoints keyed by host and port, and of device sessions."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._endpoints: dict[tuple[str, int], MideaEndpoint] = {}
+
+        # Authenticated devices of unloaded entries kept for reuse by a reload
+        self._sessions: dict[str, _ParkedSession] = {}
+
+        hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop)
+
+    def acquire(self, host: str, port: int, key: str) -> MideaEndpoint:
+        """Add a member to the endpoint at host and port, creating it if needed."""
+        if (endpoint := self._endpoints.get((host, port))) is None:
+            endpoint = self._endpoints[(host, port)] = MideaEndpoint(
+                host, port)
+
+        endpoint.join(key)
+        if endpoint.members > 1:
+            _LOGGER.debug("Sharing endpoint %s:%d between %d devices.",
+                          host, port, endpoint.members)
+
+        return endpoint
+
+    def release(self, host: str, port: int, key: str) -> None:
+        """Remove a member from an endpoint, discarding it once unused."""
+        if (endpoint := self._endpoints.get((host, port))) is None:
+            return
+
+        endpoint.leave(key)
+        if not endpoint.members:
+            del self._endpoints[(host, port)]
+
+    @callback
+    def park_session(self, key: str, credentials: Hashable, device: MideaDevice) -> None:
+        """Keep the session of an unloaded entry until it's claimed or times out."""
+        self.discard_session(key)
+
+        handle = self._hass.loop.call_later(
+            SESSION_REUSE_TIMEOUT, self.discard_session, key)
+        self._sessions[key] = _ParkedSession(
+            credentials, device, handle.cancel)
+
+    @callback
+    def claim_session(self, key: str, credentials: Hashable) -> MideaDevice | None:
+        """Return the parked session of an entry if its credentials are unchanged."""
+        if (session := self._sessions.pop(key, None)) is None:
+            return None
+
+        session.cancel()
+
+        if session.credentials != credentials:
+            _disconnect(session.device)
+            return None
+
+        return session.device
+
+    @callback
+    def discard_session(self, key: str) -> None:
+        """Close and forget the parked session of an entry."""
+        if (session := self._sessions.pop(key, None)) is not None:
+            session.cancel()
+            _disconnect(session.device)
+
+    @callback
+    def _async_handle_stop(self, event: Event) -> None:
+        """Close all parked sessions."""
+        for key in list(self._sessions):
+            self.discard_session(key)
+
+
+def rotation_delay(device: MideaDevice) -> float | None:
+    """Return the seconds until the device connection should be replaced.
+
+    Returns None if the device isn't connected or its connection doesn't expire.
+    """
+    # The library doesn't expose connection state, so inspect the LAN object
+    lan = getattr(device, "_lan", None)
+    if not isinstance(lan, LAN):
+        return None
+
+    if lan._protocol is None or lan._connection_expiration is None:
+        return None
+
+    # An expiration left over from a previous lifetime is never refreshed
+    if not (lifetime := lan.max_connection_lifetime):
+        return None
+
+    # Leave time to reconnect before expiration even with short lifetimes
+    margin = min(CONNECTION_ROTATION_MARGIN, lifetime / 3)
+
+    remaining = (lan._connection_expiration -
+                 datetime.now(timezone.utc)).total_seconds()
+    return max(0, remaining - margin)
+
+
+def set_connection_lifetime(device: MideaDevice, seconds: int | None) -> None:
+    """Set the maximum connection lifetime of a device.
+
+    A changed lifetime closes the current connection, since its expiration
+    was set from the previous lifetime and would otherwise be kept.
+    """
+    lan = getattr(device, "_lan", None)
+    if isinstance(lan, LAN) and lan.max_connection_lifetime != seconds:
+        lan._disconnect()
+        lan._connection_expiration = None
+
+    device.set_max_connection_lifetime(seconds)
+
+
+def _disconnect(device: MideaDevice) -> None:
+    """Close the device connection."""
+    if isinstance(lan := getattr(device, "_lan", None), LAN):
+        lan._disconnect()
+
+
+async def async_rotate_connection(device: MideaDevice) -> None:
+    """Replace the device connection, authenticating with the stored token and key."""
+    lan = device._lan
+    lan._disconnect()
+
+    if lan.token is not None and lan.key is not None:
+        # Connects and restarts the lifetime of the connection
+        await lan.authenticate()
+    else:
+        await lan._connect()
+
+
+def get_connection_manager(hass: HomeAssistant) -> MideaConnectionManager:
+    """Get the integration wide connection manager."""
+    if (manager := hass.data.get(DATA_CONNECTION_MANAGER)) is None:
+        manager = hass.data[DATA_CONNECTION_MANAGER] = MideaConnectionManager(
+            hass)
+
+    return manager
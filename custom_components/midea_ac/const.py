@@ -7,6 +7,51 @@ from msmart.device import CommercialAirConditioner as CC
 DOMAIN = "midea_ac"
 UPDATE_INTERVAL = 15
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+ADAPTIVE_UPDATE_INTERVAL_MAX = 120
+APPLY_COALESCE_WINDOW = 0.1
+WRITE_SUPPRESSION_MAX_AGE = 10
+CONF_OPTIMISTIC_STATE = "optimistic_state"
+
+# Device flags enabling group data requests
+GROUP_REQUEST_FLAGS = {
+    1: "enable_group1_data_requests",
+    2: "enable_group2_data_requests",
+    4: "enable_energy_usage_requests",
+    5: "enable_group5_data_requests",
+    7: "enable_group7_data_requests",
+    11: "enable_group11_data_requests",
+}
+GROUP_REQUEST_TOLERANCE = 1
+
+# Consecutive failed polls before backing off and the maximum backoff in seconds
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_BACKOFF_MAX = 600
+
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+DATA_STARTUP_SEMAPHORE = f"{DOMAIN}_startup_semaphore"
+DATA_CAPABILITY_CACHE = f"{DOMAIN}_capability_cache"
+DATA_CONNECTION_MANAGER = f"{DOMAIN}_connection_manager"
+DATA_APPLIED_CONFIG = f"{DOMAIN}_applied_config"
+
+# Seconds before a connection expires to replace it with a new one
+CONNECTION_ROTATION_MARGIN = 10
+
+# Seconds the session of an unloaded entry is kept for reuse by a reload
+SESSION_REUSE_TIMEOUT = 60
+
+# Limits of discovery across multiple hosts and networks
+DISCOVERY_MAX_TARGETS = 1024
+DISCOVERY_CONCURRENCY = 256
+
+# Startup pipeline limits
+STARTUP_CONCURRENCY = 8
+AUTHENTICATE_TIMEOUT = 10
+CAPABILITIES_TIMEOUT = 10
+FIRST_REFRESH_TIMEOUT = 15
+CAPABILITIES_RETRY_INTERVAL = 60
+CAPABILITIES_RETRY_ATTEMPTS = 5
+CAPABILITIES_REVALIDATE_DELAY = 300
 
 CONF_KEY = "k1"
 CONF_BEEP = "prompt_tone"
@@ -32,6 +77,44 @@ PRESET_IECO = "ieco"
 PRESET_SILENT = "silent"
 
 
+class RefreshTier(StrEnum):
+    FAST = auto()
+    NORMAL = auto()
+    SLOW = auto()
+
+
+# Minimum seconds between requests of data in each tier, 0 to request every poll
+REFRESH_TIER_PERIODS = {
+    RefreshTier.FAST: 0,
+    RefreshTier.NORMAL: 60,
+    RefreshTier.SLOW: 300,
+}
+
+
+class CircuitState(StrEnum):
+    CLOSED = auto()
+    OPEN = auto()
+    HALF_OPEN = auto()
+
+
+class ApplyResult(StrEnum):
+    WRITTEN = auto()
+    SUPPRESSED = auto()
+    NOTHING_STAGED = auto()
+
+
+class TimingMetric(StrEnum):
+    REFRESH = auto()
+    APPLY = auto()
+    LOCK_WAIT = auto()
+    AUTHENTICATE = auto()
+
+
+# Number of samples kept per timing metric and histogram bucket bounds in seconds
+TIMING_WINDOW = 100
+TIMING_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
 class EnergyFormat(StrEnum):
     BCD = auto()
     BINARY = auto()
@@ -2,25 +2,235 @@
 
 import datetime
 import logging
-from asyncio import Lock
-from typing import Generic
+import math
+import random
+from asyncio import Lock, Task, shield, sleep
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Generic, Mapping
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import (CoordinatorEntity,
-                                                      DataUpdateCoordinator)
-
-from .const import DOMAIN, UPDATE_INTERVAL, MideaDevice
+                                                      DataUpdateCoordinator,
+                                                      UpdateFailed)
+from msmart.lan import ProtocolError
+
+from .connection import (MideaEndpoint, async_rotate_connection,
+                         rotation_delay, set_connection_lifetime)
+from .const import (ADAPTIVE_UPDATE_INTERVAL_MAX, APPLY_COALESCE_WINDOW,
+                    CIRCUIT_BREAKER_BACKOFF_MAX, CIRCUIT_BREAKER_THRESHOLD,
+                    DATA_POLL_SCHEDULER, DOMAIN, GROUP_REQUEST_FLAGS,
+                    GROUP_REQUEST_TOLERANCE, REFRESH_TIER_PERIODS,
+                    UPDATE_INTERVAL, ApplyResult, CircuitState, MideaDevice,
+                    RefreshTier, TimingMetric)
 from .device_proxy import MideaDeviceProxy
+from .timing import MideaTimings
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class MideaPollScheduler:
+    """Integration wide scheduler that staggers device polls across the update interval."""
+
+    def __init__(self) -> None:
+        # Phase of each member as a fraction of its update interval
+        self._phases: dict[str, float] = {}
+
+    def register(self, key: str) -> None:
+        """Add a member to the schedule and rebalance phases."""
+        self._phases[key] = 0
+        self._rebalance()
+
+    def unregister(self, key: str) -> None:
+        """Remove a member from the schedule and rebalance phases."""
+        if self._phases.pop(key, None) is not None:
+            self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Spread member phases evenly across the interval."""
+        count = len(self._phases)
+        for index, key in enumerate(self._phases):
+            self._phases[key] = index / count
+
+    def phase(self, key: str) -> float:
+        """Return the phase fraction of a member."""
+        return self._phases.get(key, 0)
+
+    def next_refresh(self, key: str, now: float, interval: float) -> float:
+        """Return the next refresh time on the member's phase grid."""
+        offset = self.phase(key) * interval
+
+        # Select the first slot at least half an interval away so a late or
+        # manually requested refresh doesn't cause back-to-back polls
+        slot = math.floor((now + interval / 2 - offset) / interval) + 1
+
+        return slot * interval + offset
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """Return the current phase assignments."""
+        return dict(self._phases)
+
+
+class MideaGroupRequestPlanner:
+    """Planner that selects the group data requests due in each refresh."""
+
+    def __init__(self, periods: dict[RefreshTier, float]) -> None:
+        # Minimum time in seconds between requests of each tier
+        self._periods = dict(periods)
+        self._subscribers: dict[int, dict[RefreshTier, int]] = {}
+        self._last_requested: dict[int, float] = {}
+
+    def subscribe(self, group: int, tier: RefreshTier) -> None:
+        """Add a subscriber to a group at a refresh tier."""
+        tiers = self._subscribers.setdefault(group, {})
+        tiers[tier] = tiers.get(tier, 0) + 1
+
+    def unsubscribe(self, group: int, tier: RefreshTier) -> None:
+        """Remove a subscriber from a group at a refresh tier."""
+        tiers = self._subscribers[group]
+        tiers[tier] -= 1
+        if not tiers[tier]:
+            del tiers[tier]
+
+        # Request immediately if resubscribed
+        if not tiers:
+            del self._subscribers[group]
+            self._last_requested.pop(group, None)
+
+    def subscribers(self, group: int) -> int:
+        """Return the number of subscribers of a group."""
+        return sum(self._subscribers.get(group, {}).values())
+
+    @property
+    def active(self) -> set[int]:
+        """Return the groups with subscribers."""
+        return set(self._subscribers)
+
+    def tier(self, group: int) -> RefreshTier | None:
+        """Return the effective tier of a group, the fastest tier of its subscribers."""
+        if not (tiers := self._subscribers.get(group)):
+            return None
+
+        return min(tiers, key=self._periods.__getitem__)
+
+    def period(self, tier: RefreshTier) -> float:
+        """Return the minimum time between requests of a tier."""
+        return self._periods[tier]
+
+    def due(self, now: float) -> set[int]:
+        """Return the subscribed groups due to be requested."""
+        return {
+            group for group in self.active
+            if group not in self._last_requested
+            # Allow some tolerance so poll jitter doesn't skip an entire interval
+            or now - self._last_requested[group] >= self.period(self.tier(group)) - GROUP_REQUEST_TOLERANCE
+        }
+
+    def mark_requested(self, groups: set[int], now: float) -> None:
+        """Record the time groups were successfully requested."""
+        for group in groups:
+            self._last_requested[group] = now
+
+
+class MideaCircuitBreaker:
+    """Circuit breaker that backs off polling of an unreachable device."""
+
+    def __init__(self, base_delay: float,
+                 threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+                 max_delay: float = CIRCUIT_BREAKER_BACKOFF_MAX) -> None:
+        self._base_delay = base_delay
+        self._threshold = threshold
+        self._max_delay = max_delay
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def base_delay(self) -> float:
+        """Return the backoff delay after the threshold is reached."""
+        return self._base_delay
+
+    @base_delay.setter
+    def base_delay(self, delay: float) -> None:
+        """Set the backoff delay after the threshold is reached."""
+        self._base_delay = delay
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the state of the breaker."""
+        return self._state
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    def allow(self, now: float) -> bool:
+        """Return True if a request may be made, moving to half-open once the backoff expires."""
+        if self._state == CircuitState.OPEN:
+            if now < self._retry_at:
+                return False
+
+            # Allow a single probe
+            self._state = CircuitState.HALF_OPEN
+
+        return True
+
+    def record_success(self) -> bool:
+        """Close the breaker. Return True if it was not already closed."""
+        recovered = self._state != CircuitState.CLOSED
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        return recovered
+
+    def record_failure(self, now: float) -> float | None:
+        """Record a failure. Return the backoff delay if the breaker opened."""
+        self._failures += 1
+
+        if self._state != CircuitState.HALF_OPEN and self._failures < self._threshold:
+            return None
+
+        # Double the backoff for every failure past the threshold, with jitter
+        # so devices that dropped off together don't retry in lockstep
+        exponent = min(self._failures - self._threshold, 32)
+        delay = min(self._max_delay, self._base_delay * 2 ** exponent)
+        delay = random.uniform(delay / 2, delay)
+
+        self._state = CircuitState.OPEN
+        self._retry_at = now + delay
+        return delay
+
+    def retry_in(self, now: float) -> float:
+        """Return the seconds until the breaker allows a probe."""
+        return max(0, self._retry_at - now)
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the state of the breaker."""
+        return {
+            "state": self._state,
+            "failures": self._failures,
+            "retry_in": (round(self.retry_in(now), 1)
+                         if self._state == CircuitState.OPEN else None),
+        }
+
+
+def get_poll_scheduler(hass: HomeAssistant) -> MideaPollScheduler:
+    """Get the integration wide poll scheduler."""
+    return hass.data.setdefault(DATA_POLL_SCHEDULER, MideaPollScheduler())
+
+
 class MideaDeviceUpdateCoordinator(DataUpdateCoordinator, Generic[MideaDevice]):
     """Device update coordinator for Midea Smart AC."""
 
     def __init__(self, hass: HomeAssistant, device: MideaDevice,
-                 update_interval: int = UPDATE_INTERVAL) -> None:
+                 update_interval: int = UPDATE_INTERVAL,
+                 *,
+                 adaptive: bool = False,
+                 optimistic: bool = False,
+                 apply_window: float = APPLY_COALESCE_WINDOW,
+                 endpoint: MideaEndpoint | None = None) -> None:
         super().__init__(
             hass,
             _LOGGER,
@@ -36,224 +246,774 @@ class MideaDeviceUpdateCoordinator(DataUpdateCoordinator, Generic[MideaDevice]):
 
         self._lock = Lock()
         self._proxy: MideaDeviceProxy[MideaDevice] = MideaDeviceProxy(device)
-        self._energy_sensors = 0
-        self._group1_entities = 0
-        self._group2_entities = 0
-        self._group5_entities = 0
-        self._group7_entities = 0
-        self._group11_entities = 0
+
+        # Endpoint shared with other devices at the same host and port
+        self._endpoint = endpoint
+
+        # Connections are replaced before they expire so requests don't wait on a reconnect
+        self._unsub_rotation: CALLBACK_TYPE | None = None
+        self._connection_rotations = 0
+        self._rotating = False
+
+        # Timing instrumentation of device requests
+        self._timings = MideaTimings()
+
+        # Backs off polling after consecutive failures
+        self._circuit_breaker = MideaCircuitBreaker(update_interval)
+        self._circuit_listeners: list[CALLBACK_TYPE] = []
+
+        # Plans which group data requests are included in each refresh
+        self._group_planner = MideaGroupRequestPlanner(REFRESH_TIER_PERIODS)
+
+        # Adaptive polling backs off while the device state is unchanged
+        self._adaptive = adaptive
+        self._base_update_interval = update_interval
+        self._last_state: dict[str, Any] | None = None
+
+        # Optimistic mode publishes applied state without an immediate refresh
+        self._optimistic = optimistic
+
+        # Changes staged within the apply window are coalesced into a single write
+        self._apply_window = apply_window
+        self._pending_apply: Task[None] | None = None
+
+        # Writes take priority over polls. Polls are dropped while a write is
+        # pending and an in-flight poll is preempted before its group data requests
+        self._pending_writes = 0
+        self._dropped_polls = 0
+        self._preempted_polls = 0
+
+        # Property values last published to listeners and the properties changed by the last refresh
+        self._published: dict[str, Any] = {}
+        self._changed_properties: set[str] | None = None
+
+        # Device availability as of the last published state
+        self._available = False
+
+        # Incremented whenever published values may have changed
+        self._generation = 0
+
+        # Index of listeners by dependent property, and listeners without dependencies
+        self._property_listeners: dict[str, dict[int, CALLBACK_TYPE]] = {}
+        self._unindexed_listeners: dict[int, CALLBACK_TYPE] = {}
+        self._last_indexed_id = 0
+
+        # Listeners notified when the config entry options change
+        self._options_listeners: list[Callable[[Mapping[str, Any]], None]] = []
+
+        # Register with the fleet scheduler to stagger polls against other devices
+        self._scheduler = get_poll_scheduler(hass)
+        self._scheduler_key = (self.config_entry.entry_id
+                               if self.config_entry else str(device.id))
+        self._scheduler.register(self._scheduler_key)
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule a refresh aligned to the device's poll phase."""
+        if self._update_interval_seconds is None:
+            return
+
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+
+        self._async_unsub_refresh()
+
+        loop = self.hass.loop
+        next_refresh = self._scheduler.next_refresh(
+            self._scheduler_key, loop.time(), self._update_interval_seconds)
+        self._unsub_refresh = loop.call_at(
+            next_refresh, self._handle_scheduled_refresh).cancel
+
+    @callback
+    def _handle_scheduled_refresh(self) -> None:
+        """Start a scheduled refresh in the background."""
+        if self.config_entry:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._handle_refresh_interval(),
+                name=f"{self.name} - {self.config_entry.title} - refresh",
+                eager_start=True,
+            )
+        else:
+            self.hass.async_create_background_task(
+                self._handle_refresh_interval(),
+                name=f"{self.name} - refresh",
+                eager_start=True,
+            )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh and leave the poll schedule."""
+        await super().async_shutdown()
+
+        self._scheduler.unregister(self._scheduler_key)
+
+        if self._unsub_rotation:
+            self._unsub_rotation()
+            self._unsub_rotation = None
+
+    @property
+    def poll_schedule(self) -> dict[str, Any]:
+        """Return the poll phase information of the coordinator."""
+        interval = self._update_interval_seconds or 0
+        return {
+            "interval": interval,
+            "adaptive": self._adaptive,
+            "phase": self._scheduler.phase(self._scheduler_key),
+            "offset": self._scheduler.phase(self._scheduler_key) * interval,
+            "assignments": self._scheduler.phases,
+        }
+
+    @property
+    def connection_rotations(self) -> int:
+        """Return the number of connections replaced ahead of their expiration."""
+        return self._connection_rotations
+
+    @property
+    def endpoint(self) -> MideaEndpoint | None:
+        """Return the endpoint shared with other devices at the same host and port."""
+        return self._endpoint
+
+    @property
+    def poll_preemption(self) -> dict[str, int]:
+        """Return the number of polls dropped or preempted in favor of writes."""
+        return {
+            "dropped": self._dropped_polls,
+            "preempted": self._preempted_polls,
+        }
+
+    def _drop_poll(self) -> None:
+        """Skip a poll without notifying dependent listeners, keeping any previous failure."""
+        _LOGGER.debug(
+            "Dropping poll of device ID %s in favor of a pending write.", self._proxy.id)
+        self._dropped_polls += 1
+
+        # A skipped poll can't confirm a failed device recovered
+        if not self.last_update_success:
+            raise UpdateFailed(
+                f"Device ID {self._proxy.id} poll dropped in favor of a pending write.")
+
+        self._changed_properties = set()
 
     async def _async_update_data(self) -> None:
         """Update the device data."""
-        async with self._lock:
-            await self._proxy.refresh()
+        # Notify all listeners unless the refresh completes
+        self._changed_properties = None
+
+        # Drop polls rather than queue them behind a pending write
+        if self._pending_writes:
+            self._drop_poll()
+            return
+
+        # Skip polls of an unreachable device until the backoff expires, keeping
+        # the coordinator in a failed state meanwhile
+        now = self.hass.loop.time()
+        if not self._circuit_breaker.allow(now):
+            raise UpdateFailed(
+                f"Device ID {self._proxy.id} is unreachable. "
+                f"Retrying in {self._circuit_breaker.retry_in(now):.0f} seconds.")
+
+        # Publish that an unreachable device is being probed
+        if self._circuit_breaker.state == CircuitState.HALF_OPEN:
+            self._async_update_circuit_listeners()
+
+        async with self._locked():
+            # Check again in case a write arrived while waiting for the lock
+            if self._pending_writes:
+                self._drop_poll()
+                return
+
+            # Probe an unreachable device without group data requests
+            now = self.hass.loop.time()
+            if self._circuit_breaker.state == CircuitState.HALF_OPEN:
+                groups = set()
+            else:
+                groups = self._group_planner.due(now)
+
+            try:
+                with self._timings.measure(TimingMetric.REFRESH) as timer:
+                    completed = await self._async_preemptible_refresh(groups)
+
+                    # Only measure complete polls
+                    if not completed:
+                        timer.cancel()
+            except Exception:
+                self._record_failure()
+                raise
+
+        if self._proxy.online:
+            self._record_success()
+        else:
+            self._record_failure()
+
+        # Groups skipped by a preempted or failed poll remain due
+        if completed and self._proxy.online:
+            self._group_planner.mark_requested(groups, now)
+
+        self._changed_properties = self._diff_properties()
+
+        if self._adaptive:
+            self._update_adaptive_interval()
+
+    def _record_success(self) -> None:
+        """Close the circuit breaker after a successful request."""
+        if self._circuit_breaker.record_success():
+            _LOGGER.info("Device ID %s is reachable again.", self._proxy.id)
+            self._async_update_circuit_listeners()
+
+    def _record_failure(self) -> None:
+        """Record a failed request and log if the circuit breaker opened."""
+        # Back off from the end of the failed request, which may have taken
+        # several timeouts, rather than from when it started
+        if (delay := self._circuit_breaker.record_failure(self.hass.loop.time())) is not None:
+            _LOGGER.warning(
+                "Device ID %s is unreachable after %d attempts. Retrying in %d seconds.",
+                self._proxy.id, self._circuit_breaker.failures, delay)
+            self._async_update_circuit_listeners()
+
+    @property
+    def circuit_breaker(self) -> dict[str, Any]:
+        """Return the circuit breaker state of the device."""
+        return self._circuit_breaker.as_dict(self.hass.loop.time())
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Return the state of the circuit breaker."""
+        return self._circuit_breaker.state
+
+    @callback
+    def async_add_circuit_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for circuit breaker state changes.
+
+        Failed refreshes don't update coordinator listeners, so the breaker
+        state is published separately.
+        """
+        self._circuit_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._circuit_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_update_circuit_listeners(self) -> None:
+        """Notify listeners of a circuit breaker state change."""
+        for update_callback in list(self._circuit_listeners):
+            update_callback()
+
+    def _diff_properties(self) -> set[str] | None:
+        """Compare listened properties against the published values.
+
+        Returns the set of changed properties, or None if all listeners should be notified.
+        """
+        changed = set()
+        for name in {"online", *self._property_listeners}:
+            value = self._proxy.read(name)
+            if name not in self._published or self._published[name] != value:
+                self._published[name] = value
+                changed.add(name)
+
+        # Cache availability so entities don't each query the device
+        self._available = bool(self._published["online"])
+        self._generation += 1
+
+        # Availability affects every entity
+        if "online" in changed:
+            return None
+
+        return changed
+
+    @property
+    def available(self) -> bool:
+        """Return the device availability as of the last published state, False if the last update failed."""
+        return self.last_update_success and self._available
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the published state."""
+        return self._generation
+
+    def published_value(self, name: str) -> Any:
+        """Return the last published value of a listened property."""
+        return self._published.get(name)
+
+    @callback
+    def async_set_polling(self, update_interval: int, *,
+                          adaptive: bool, optimistic: bool) -> None:
+        """Update the polling options in place."""
+        self._base_update_interval = update_interval
+        self._circuit_breaker.base_delay = update_interval
+        self._adaptive = adaptive
+        self._optimistic = optimistic
+
+        # Restart adaptive backoff from the new interval
+        self._last_state = None
+        self._reset_update_interval()
+
+        # Move the next poll onto the new schedule
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def async_set_connection_lifetime(self, seconds: int | None) -> None:
+        """Update the maximum connection lifetime once no request is in progress."""
+        async with self._locked():
+            set_connection_lifetime(self._proxy._device, seconds)
+
+    @callback
+    def async_add_options_listener(self,
+                                   update_callback: Callable[[Mapping[str, Any]], None]) -> CALLBACK_TYPE:
+        """Listen for config entry option changes applied without a reload."""
+        self._options_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._options_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_options(self, options: Mapping[str, Any]) -> None:
+        """Notify listeners of changed config entry options."""
+        for update_callback in list(self._options_listeners):
+            update_callback(options)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates and index the listener by its dependent properties."""
+        remove_listener = super().async_add_listener(update_callback, context)
+
+        self._last_indexed_id += 1
+        listener_id = self._last_indexed_id
+
+        if context is None:
+            self._unindexed_listeners[listener_id] = update_callback
+        else:
+            for name in context:
+                # Seed the published value for entities added after a refresh
+                if name not in self._published:
+                    self._published[name] = self._proxy.read(name)
+                    self._generation += 1
+
+                self._property_listeners.setdefault(
+                    name, {})[listener_id] = update_callback
+
+        @callback
+        def _remove_listener() -> None:
+            self._unindexed_listeners.pop(listener_id, None)
+            for name in context or ():
+                listeners = self._property_listeners[name]
+                listeners.pop(listener_id)
+                if not listeners:
+                    del self._property_listeners[name]
+
+            remove_listener()
+
+        return _remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners that depend on changed properties."""
+        changed = self._changed_properties
+
+        # Notify all listeners on any other update, e.g. errors
+        self._changed_properties = None
+
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        # Collect dependent listeners via the index, each listener once
+        listeners = dict(self._unindexed_listeners)
+        for name in changed:
+            listeners.update(self._property_listeners.get(name, {}))
+
+        for update_callback in listeners.values():
+            update_callback()
+
+    def _update_adaptive_interval(self) -> None:
+        """Lengthen the update interval while the device state is unchanged."""
+        state = self._proxy.to_dict()
+
+        if state != self._last_state:
+            # Device state changed, return to the fast rate
+            self._reset_update_interval()
+        else:
+            # Back off while nothing is changing
+            interval = min(self._update_interval_seconds * 2,
+                           max(ADAPTIVE_UPDATE_INTERVAL_MAX, self._base_update_interval))
+            if interval != self._update_interval_seconds:
+                _LOGGER.debug(
+                    "Device state unchanged. Increasing update interval to %d seconds for device ID %s.",
+                    interval, self._proxy.id)
+                self.update_interval = datetime.timedelta(seconds=interval)
+
+        self._last_state = state
+
+    def _reset_update_interval(self) -> None:
+        """Restore the configured update interval."""
+        self.update_interval = datetime.timedelta(
+            seconds=self._base_update_interval)
+
+    def _request_groups(self, groups: set[int]) -> None:
+        """Enable requests of the given groups and disable the other active groups."""
+        for group in self._group_planner.active:
+            self._proxy.set_direct(GROUP_REQUEST_FLAGS[group], group in groups)
+
+    async def _async_preemptible_refresh(self, groups: set[int]) -> bool:
+        """Refresh the device state then the due group data. Return False if preempted by a write.
+
+        Group data is requested by a separate refresh so a pending write
+        preempts the poll once the device state is known. A refresh in flight
+        is never cancelled, since the library drops the connection on a
+        cancelled read.
+        """
+        self._request_groups(set())
+        await self._proxy.refresh()
+
+        # Nothing more to request, or the device didn't respond
+        if not groups or not self._proxy.online:
+            return True
+
+        if self._pending_writes:
+            _LOGGER.debug(
+                "Preempting poll of device ID %s for a pending write.", self._proxy.id)
+            self._preempted_polls += 1
+            return False
+
+        self._request_groups(groups)
+        await self._proxy.refresh()
+        return True
+
+    @asynccontextmanager
+    async def _locked(self) -> AsyncIterator[None]:
+        """Acquire the device and endpoint locks, measuring the wait."""
+        endpoint = self._endpoint
+        if self._lock.locked() or (endpoint and endpoint.locked()):
+            self._timings.record_contention()
+
+        with self._timings.measure(TimingMetric.LOCK_WAIT):
+            await self._lock.acquire()
+            if endpoint:
+                try:
+                    await endpoint.acquire()
+                except BaseException:
+                    self._lock.release()
+                    raise
+
+        try:
+            yield
+        finally:
+            if endpoint:
+                endpoint.release()
+            self._lock.release()
+
+            # Requests may have opened a new connection
+            self._schedule_rotation()
+
+    @callback
+    def _schedule_rotation(self) -> None:
+        """Schedule replacement of the device connection ahead of its expiration."""
+        if self._unsub_rotation:
+            self._unsub_rotation()
+            self._unsub_rotation = None
+
+        if (delay := rotation_delay(self._proxy._device)) is None:
+            return
+
+        # Don't retry a rotation that left the connection due for replacement
+        if self._rotating and delay == 0:
+            return
+
+        self._unsub_rotation = self.hass.loop.call_later(
+            delay, self._handle_rotation).cancel
+
+    @callback
+    def _handle_rotation(self) -> None:
+        """Start a connection rotation in the background."""
+        self._unsub_rotation = None
+
+        if self.config_entry:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_rotate_connection(),
+                name=f"{self.name} - {self.config_entry.title} - connection",
+            )
+        else:
+            self.hass.async_create_background_task(
+                self._async_rotate_connection(),
+                name=f"{self.name} - connection",
+            )
+
+    async def _async_rotate_connection(self) -> None:
+        """Replace the device connection while no request is in progress."""
+        # Leave unreachable devices to reconnect on their next poll
+        if self._circuit_breaker.state != CircuitState.CLOSED:
+            return
+
+        # Don't hold up a pending write, its request reschedules the rotation
+        if self._pending_writes:
+            return
+
+        self._rotating = True
+        try:
+            async with self._locked():
+                # A write may have arrived while waiting for the lock
+                if self._pending_writes:
+                    return
+
+                # A request may have replaced an expired connection while waiting
+                if (delay := rotation_delay(self._proxy._device)) is None or delay > 0:
+                    return
+
+                _LOGGER.debug(
+                    "Replacing connection to device ID %s before it expires.", self._proxy.id)
+                try:
+                    await async_rotate_connection(self._proxy._device)
+                except (TimeoutError, ProtocolError) as e:
+                    # The next request will reconnect on demand
+                    _LOGGER.debug(
+                        "Failed to replace connection to device ID %s: %s", self._proxy.id, e)
+                    return
+
+                self._connection_rotations += 1
+        finally:
+            self._rotating = False
+
+    async def async_get_capabilities(self) -> bool:
+        """Query the device capabilities. Return True if the device responded."""
+        async with self._locked():
+            await self._proxy.get_capabilities()
+
+        return self._proxy.online
 
     async def apply(self) -> None:
-        """Apply changes to the device and update HA state."""
-        async with self._lock:
-            await self._proxy.apply()
+        """Apply changes to the device and update HA state.
+
+        Changes staged by concurrent callers within the apply window are
+        merged into a single write and every caller resolves when it completes.
+        """
+        if self._pending_apply is None:
+            self._pending_apply = self.hass.async_create_task(
+                self._async_coalesced_apply(), f"{DOMAIN} {self._proxy.id} apply")
+
+            # Give the write priority over any in-flight poll
+            self._pending_writes += 1
+
+        # Shield the shared write from cancellation of any one caller
+        await shield(self._pending_apply)
+
+    async def _async_coalesced_apply(self) -> None:
+        """Wait for the apply window to close, then apply all staged changes."""
+        try:
+            try:
+                await sleep(self._apply_window)
+            finally:
+                # Changes staged from here on belong to the next write
+                self._pending_apply = None
+
+            async with self._locked():
+                with self._timings.measure(TimingMetric.APPLY) as timer:
+                    result = await self._proxy.apply()
+
+                    # Only measure actual device writes
+                    if result != ApplyResult.WRITTEN:
+                        timer.cancel()
+        finally:
+            # Polls may resume once the write is done
+            self._pending_writes -= 1
+
+        # Nothing to refresh if the write was skipped
+        if result != ApplyResult.WRITTEN:
+            return
+
+        # A write that reached the device proves it is reachable
+        if self._proxy.online:
+            self._record_success()
+
+        # Return to the fast rate after a write
+        if self._adaptive:
+            self._last_state = None
+            self._reset_update_interval()
+
+        if self._optimistic:
+            self._publish_applied_state()
+            return
 
         # Update state
         await self.async_request_refresh()
 
+    @callback
+    def _publish_applied_state(self) -> None:
+        """Publish the applied state and defer verification to the next scheduled poll.
+
+        The next poll compares the device state against the published values,
+        so only properties the device reports differently are updated again.
+        """
+        self._changed_properties = self._diff_properties()
+        self.async_update_listeners()
+
+        # Bring forward a poll that was scheduled with a backed off interval
+        if self._adaptive and self._listeners:
+            self._schedule_refresh()
+
     @property
     def device(self) -> MideaDeviceProxy[MideaDevice]:
         """Return the device proxy."""
         return self._proxy
 
-    def register_energy_sensor(self) -> None:
-        """Record that an energy sensor is active."""
+    @property
+    def timings(self) -> MideaTimings:
+        """Return the timing instrumentation of the device."""
+        return self._timings
 
-        if not hasattr(self._proxy, "enable_energy_usage_requests"):
-            raise TypeError("Device does not support energy sensors.")
+    def register_group_entity(self, group: int, tier: RefreshTier = RefreshTier.FAST) -> None:
+        """Record that an entity relying on group data is active."""
+        if not hasattr(self._proxy, GROUP_REQUEST_FLAGS[group]):
+            raise TypeError(f"Device does not support group {group} data.")
 
-        self._energy_sensors += 1
+        self._group_planner.subscribe(group, tier)
 
         # Enable requests
-        self._proxy.set_direct("enable_energy_usage_requests", True)
-
-    def unregister_energy_sensor(self) -> None:
-        """Record that an energy sensor is inactive."""
-
-        if not hasattr(self._proxy, "enable_energy_usage_requests"):
-            raise TypeError("Device does not support energy sensors.")
-
-        self._energy_sensors -= 1
-
-        # Disable requests if last sensor
-        self._proxy.set_direct(
-            "enable_energy_usage_requests", self._energy_sensors > 0)
-
-    def register_group1_entity(self) -> None:
-        """Record that a group1 data entity is active."""
-        if not hasattr(self._proxy, "enable_group1_data_requests"):
-            raise TypeError("Device does not support group 1 data.")
-        self._group1_entities += 1
-        self._proxy.set_direct("enable_group1_data_requests", True)
-
-    def unregister_group1_entity(self) -> None:
-        """Record that a group1 data entity is inactive."""
-        if not hasattr(self._proxy, "enable_group1_data_requests"):
-            raise TypeError("Device does not support group 1 data.")
-        self._group1_entities -= 1
-        self._proxy.set_direct(
-            "enable_group1_data_requests", self._group1_entities > 0)
-
-    def register_group2_entity(self) -> None:
-        """Record that a group2 data entity is active."""
-        if not hasattr(self._proxy, "enable_group2_data_requests"):
-            raise TypeError("Device does not support group 2 data.")
-        self._group2_entities += 1
-        self._proxy.set_direct("enable_group2_data_requests", True)
-
-    def unregister_group2_entity(self) -> None:
-        """Record that a group2 data entity is inactive."""
-        if not hasattr(self._proxy, "enable_group2_data_requests"):
-            raise TypeError("Device does not support group 2 data.")
-        self._group2_entities -= 1
-        self._proxy.set_direct(
-            "enable_group2_data_requests", self._group2_entities > 0)
-
-    def register_group5_entity(self) -> None:
-        """Record that a group5 data entity is active."""
-
-        if not hasattr(self._proxy, "enable_group5_data_requests"):
-            raise TypeError("Device does not support group 5 data.")
-
-        self._group5_entities += 1
+        self._proxy.set_direct(GROUP_REQUEST_FLAGS[group], True)
 
-        # Enable requests
-        self._proxy.set_direct("enable_group5_data_requests", True)
+    def unregister_group_entity(self, group: int, tier: RefreshTier = RefreshTier.FAST) -> None:
+        """Record that an entity relying on group data is inactive."""
+        if not hasattr(self._proxy, GROUP_REQUEST_FLAGS[group]):
+            raise TypeError(f"Device does not support group {group} data.")
 
-    def unregister_group5_entity(self) -> None:
-        """Record that a group5 data entity is inactive."""
+        self._group_planner.unsubscribe(group, tier)
 
-        if not hasattr(self._proxy, "enable_group5_data_requests"):
-            raise TypeError("Device does not support group 5 data.")
+        # Disable requests if last entity
+        if not self._group_planner.subscribers(group):
+            self._proxy.set_direct(GROUP_REQUEST_FLAGS[group], False)
 
-        self._group5_entities -= 1
+    @property
+    def group_requests(self) -> dict[int, dict[str, Any]]:
+        """Return the subscribers and effective tier of each active group data request."""
+        return {
+            group: {
+                "subscribers": self._group_planner.subscribers(group),
+                "tier": self._group_planner.tier(group),
+            }
+            for group in sorted(self._group_planner.active)
+        }
 
-        # Disable requests if last entity
-        self._proxy.set_direct(
-            "enable_group5_data_requests", self._group5_entities > 0)
-
-    def register_group7_entity(self) -> None:
-        """Record that a group7 data entity is active."""
-        if not hasattr(self._proxy, "enable_group7_data_requests"):
-            raise TypeError("Device does not support group 7 data.")
-        self._group7_entities += 1
-        self._proxy.set_direct("enable_group7_data_requests", True)
-
-    def unregister_group7_entity(self) -> None:
-        """Record that a group7 data entity is inactive."""
-        if not hasattr(self._proxy, "enable_group7_data_requests"):
-            raise TypeError("Device does not support group 7 data.")
-        self._group7_entities -= 1
-        self._proxy.set_direct(
-            "enable_group7_data_requests", self._group7_entities > 0)
-
-    def register_group11_entity(self) -> None:
-        """Record that a group11 data entity is active."""
-        if not hasattr(self._proxy, "enable_group11_data_requests"):
-            raise TypeError("Device does not support group 11 data.")
-        self._group11_entities += 1
-        self._proxy.set_direct("enable_group11_data_requests", True)
-
-    def unregister_group11_entity(self) -> None:
-        """Record that a group11 data entity is inactive."""
-        if not hasattr(self._proxy, "enable_group11_data_requests"):
-            raise TypeError("Device does not support group 11 data.")
-        self._group11_entities -= 1
-        self._proxy.set_direct(
-            "enable_group11_data_requests", self._group11_entities > 0)
+    @property
+    def refresh_tiers(self) -> dict[RefreshTier, dict[str, Any]]:
+        """Return the period, groups and effective request rate of each refresh tier."""
+        interval = self._update_interval_seconds or self._base_update_interval
+
+        tiers = {}
+        for tier in RefreshTier:
+            # Requests are made on the first poll after the period has elapsed
+            period = self._group_planner.period(tier)
+            polls = max(1, math.ceil(
+                (period - GROUP_REQUEST_TOLERANCE) / interval))
+            tiers[tier] = {
+                "period": period,
+                "groups": sorted(group for group in self._group_planner.active
+                                 if self._group_planner.tier(group) == tier),
+                "requests_per_hour": round(3600 / (polls * interval), 1),
+            }
+
+        return tiers
 
 
 class MideaCoordinatorEntity(CoordinatorEntity[MideaDeviceUpdateCoordinator], Generic[MideaDevice]):
     """Coordinator entity for Midea Smart AC."""
 
+    # Device properties the entity state depends on. None to update on every refresh
+    _dependencies: frozenset[str] | None = None
+
+    # Whether the entity follows config entry option changes without a reload
+    _follows_options = False
+
     def __init__(self, coordinator: MideaDeviceUpdateCoordinator[MideaDevice]) -> None:
         super().__init__(coordinator)
 
         # Save reference to device
         self._device: MideaDeviceProxy[MideaDevice] = coordinator.device
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        # Only receive updates when dependent properties change
+        self.coordinator_context = self._dependencies
+
+        await super().async_added_to_hass()
+
+        if self._follows_options:
+            self.async_on_remove(self.coordinator.async_add_options_listener(
+                self._handle_options_update))
+
+    @callback
+    def _handle_options_update(self, options: Mapping[str, Any]) -> None:
+        """Handle changed config entry options."""
+
     @property
     def available(self) -> bool:
         """Check device availability."""
-        return self._device.online
+        return self.coordinator.available
 
 
-class MideaGroup5Entity(MideaCoordinatorEntity):
-    """Entity that relies on Group5 data."""
+class MideaGroupEntity(MideaCoordinatorEntity):
+    """Entity that relies on group data."""
+
+    # Group data the entity relies on and how often it should be refreshed
+    _group: int
+    _tier = RefreshTier.FAST
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         # Call super method to ensure lifecycle is properly handled
         await super().async_added_to_hass()
 
-        # Register group 5 sensor with coordinator
-        self.coordinator.register_group5_entity()
+        # Subscribe to group data requests
+        self.coordinator.register_group_entity(self._group, self._tier)
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
         # Call super method to ensure lifecycle is properly handled
         await super().async_will_remove_from_hass()
 
-        # Unregister group5 sensor with coordinator
-        self.coordinator.unregister_group5_entity()
+        # Unsubscribe from group data requests
+        self.coordinator.unregister_group_entity(self._group, self._tier)
 
 
-class MideaGroup1Entity(MideaCoordinatorEntity):
-    """Entity that relies on Group 1 data (outdoor unit performance)."""
+class MideaGroup4Entity(MideaGroupEntity):
+    """Entity that relies on Group 4 data (energy usage)."""
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.coordinator.register_group1_entity()
+    _group = 4
+    _tier = RefreshTier.SLOW
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
-        self.coordinator.unregister_group1_entity()
 
+class MideaGroup5Entity(MideaGroupEntity):
+    """Entity that relies on Group5 data."""
 
-class MideaGroup2Entity(MideaCoordinatorEntity):
-    """Entity that relies on Group 2 data (indoor fan data)."""
+    _group = 5
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.coordinator.register_group2_entity()
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
-        self.coordinator.unregister_group2_entity()
+class MideaGroup1Entity(MideaGroupEntity):
+    """Entity that relies on Group 1 data (outdoor unit performance)."""
 
+    _group = 1
 
-class MideaGroup7Entity(MideaCoordinatorEntity):
-    """Entity that relies on Group 7 data (outdoor unit power)."""
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.coordinator.register_group7_entity()
+class MideaGroup2Entity(MideaGroupEntity):
+    """Entity that relies on Group 2 data (indoor fan data)."""
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
-        self.coordinator.unregister_group7_entity()
+    _group = 2
 
 
-class MideaGroup11Entity(MideaCoordinatorEntity):
-    """Entity that relies on Group 11 data (louver angles)."""
+class MideaGroup7Entity(MideaGroupEntity):
+    """Entity that relies on Group 7 data (outdoor unit power)."""
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        self.coordinator.register_group11_entity()
+    _group = 7
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        await super().async_will_remove_from_hass()
-        self.coordinator.unregister_group11_entity()
+
+class MideaGroup11Entity(MideaGroupEntity):
+    """Entity that relies on Group 11 data (louver angles)."""
+
+    _group = 11
+    _tier = RefreshTier.NORMAL
@@ -1,20 +1,78 @@
 """Device proxy for Midea Smart AC."""
 
+import functools
+import inspect
 import logging
-from typing import Any, Generic
+import time
+from typing import Any, Awaitable, Callable, Generic
 
-from .const import MideaDevice
+from .const import WRITE_SUPPRESSION_MAX_AGE, ApplyResult, MideaDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Property getters, writable properties and data format getters of each device class
+_PROPERTY_ACCESSORS: dict[type, dict[str, Callable[[Any], Any]]] = {}
+_WRITABLE_PROPERTIES: dict[type, frozenset[str]] = {}
+_FORMAT_GETTERS: dict[type, dict[str, str]] = {}
+
+
+def _get_property_accessors(device_class: type) -> dict[str, Callable[[Any], Any]]:
+    """Return a map of property names to getters for a device class."""
+    if (accessors := _PROPERTY_ACCESSORS.get(device_class)) is None:
+        accessors = _PROPERTY_ACCESSORS[device_class] = {
+            name: attr.fget
+            for name in dir(device_class)
+            if isinstance(attr := getattr(device_class, name, None), property) and attr.fget is not None
+        }
+
+    return accessors
+
+
+def _get_writable_properties(device_class: type) -> frozenset[str]:
+    """Return the names of properties with a setter for a device class."""
+    if (writable := _WRITABLE_PROPERTIES.get(device_class)) is None:
+        writable = _WRITABLE_PROPERTIES[device_class] = frozenset(
+            name
+            for name in dir(device_class)
+            if isinstance(attr := getattr(device_class, name, None), property) and attr.fset is not None
+        )
+
+    return writable
+
+
+def _get_format_getters(device_class: type) -> dict[str, str]:
+    """Return a map of value names to the getter methods reading them in a data format for a device class."""
+    if (getters := _FORMAT_GETTERS.get(device_class)) is None:
+        getters = _FORMAT_GETTERS[device_class] = {
+            name.removeprefix("get_"): name
+            for name in dir(device_class)
+            if name.startswith("get_") and inspect.isfunction(attr := getattr(device_class, name, None))
+            and not inspect.iscoroutinefunction(attr)
+        }
+
+    return getters
+
 
 class MideaDeviceProxy(Generic[MideaDevice]):
     """A device proxy that stages state changes and prevents direct access to the device."""
 
+    __slots__ = ("_device", "_staged", "_suppressed_writes", "_synced_at",
+                 "_accessors", "_writable", "_format_getters", "_snapshot")
+
     def __init__(self, device: MideaDevice) -> None:
         # Create attributes via super() to avoid calling the overridden __setattr__
         super().__setattr__("_device", device)
         super().__setattr__("_staged", {})
+        super().__setattr__("_suppressed_writes", 0)
+        super().__setattr__("_accessors", _get_property_accessors(type(device)))
+        super().__setattr__("_writable", _get_writable_properties(type(device)))
+        super().__setattr__("_format_getters", _get_format_getters(type(device)))
+
+        # Monotonic time the device state was last confirmed by the device
+        super().__setattr__("_synced_at", None)
+
+        # Property values read since the device state last changed
+        super().__setattr__("_snapshot", {})
 
     def __getattr__(self, name: str) -> Any:
         """Get a property from the device."""
@@ -22,48 +80,147 @@ class MideaDeviceProxy(Generic[MideaDevice]):
         if name in self._staged:
             return self._staged[name]
 
+        # Return the value read since the last device update
+        snapshot = self._snapshot
+        if name in snapshot:
+            return snapshot[name]
+
+        # Read properties via their getter and remember the value
+        if (accessor := self._accessors.get(name)) is not None:
+            value = snapshot[name] = accessor(self._device)
+            return value
+
         # Otherwise return current device value
-        return getattr(self._device, name)
+        value = getattr(self._device, name)
+
+        # Device commands may update the device state
+        if inspect.iscoroutinefunction(value):
+            return self._invalidating(value)
+
+        return value
+
+    def read(self, name: str) -> Any:
+        """Read the current value of a property, or None if the device doesn't have it.
+
+        Values only available via a getter, such as energy usage, are read in every data format.
+        """
+        if (getter_name := self._format_getters.get(name)) is not None:
+            getter = getattr(self._device, getter_name)
+            return {format: getter(format) for format in self._device.EnergyDataFormat}
+
+        return getattr(self, name, None)
+
+    def _check_writable(self, name: str) -> None:
+        """Raise AttributeError if an attribute can't be set on the device."""
+        # Writable properties are the common case
+        if name in self._writable:
+            return
+
+        # Properties without a setter are read-only
+        if name in self._accessors:
+            raise AttributeError(f"Cannot set read-only property '{name}'")
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        """Stage a property change."""
         # Throw if trying to create an attribute
         if not hasattr(self._device, name):
             raise AttributeError(f"Cannot set attribute '{name}'")
 
-        # Check if it's a property and has a setter
-        device_attr = getattr(type(self._device), name, None)
-        if isinstance(device_attr, property) and device_attr.fset is None:
-            raise AttributeError(f"Cannot set read-only property '{name}'")
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Stage a property change."""
+        self._check_writable(name)
 
         # Save value as pending change
         self._staged[name] = value
 
+    def stage(self, changes: dict[str, Any]) -> None:
+        """Stage multiple property changes. Nothing is staged if any attribute can't be set."""
+        for name in changes:
+            self._check_writable(name)
+
+        self._staged.update(changes)
+
+    def _invalidate(self) -> None:
+        """Discard the snapshot after the device state may have changed."""
+        self._snapshot.clear()
+
+    def _invalidating(self, method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """Wrap a device command to discard the snapshot once it completes."""
+        @functools.wraps(method)
+        async def _wrapper(*args, **kwargs) -> Any:
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._invalidate()
+
+        return _wrapper
+
     async def refresh(self) -> None:
         """Update the device data."""
-        await self._device.refresh()
+        try:
+            await self._device.refresh()
+            self._mark_synced()
+        finally:
+            self._invalidate()
+
+    def _mark_synced(self) -> None:
+        """Record that the device state was just confirmed by the device."""
+        if self._device.online:
+            super().__setattr__("_synced_at", time.monotonic())
+
+    def _state_is_fresh(self) -> bool:
+        """Return True if the device state is recent enough to skip unchanged writes."""
+        return (self._synced_at is not None and
+                time.monotonic() - self._synced_at <= WRITE_SUPPRESSION_MAX_AGE)
+
+    def override_capabilities(self, overrides: dict[str, Any], **kwargs) -> None:
+        """Override the device capabilities."""
+        try:
+            self._device.override_capabilities(overrides, **kwargs)
+        finally:
+            self._invalidate()
+
+    @property
+    def suppressed_writes(self) -> int:
+        """Return the number of device writes skipped because nothing changed."""
+        return self._suppressed_writes
+
+    async def apply(self) -> ApplyResult:
+        """Apply changes to the device. Return whether they were written, suppressed or there were none."""
+        # Drop staged changes that match the current device state. The state
+        # may have been changed by a remote or the app since the last refresh,
+        # so only trust it while it's fresh
+        changes = staged = dict(self._staged)
+        if self._state_is_fresh():
+            changes = {name: value for name, value in staged.items()
+                       if getattr(self._device, name) != value}
+
+        # Clear staged changes before the write so changes staged during it are kept
+        self._staged.clear()
+
+        if not staged:
+            return ApplyResult.NOTHING_STAGED
+
+        if not changes:
+            super().__setattr__("_suppressed_writes", self._suppressed_writes + 1)
+            _LOGGER.debug(
+                "Skipping write to device ID %s, state is unchanged.", self._device.id)
+            return ApplyResult.SUPPRESSED
 
-    async def apply(self) -> None:
-        """Apply changes to the device."""
         # Apply staged changes to local device state
-        for name, value in self._staged.items():
+        for name, value in changes.items():
             setattr(self._device, name, value)
 
         # Apply state to device
-        await self._device.apply()
+        try:
+            await self._device.apply()
+            self._mark_synced()
+        finally:
+            self._invalidate()
 
-        # Clear staged changes
-        self._staged.clear()
+        return ApplyResult.WRITTEN
 
     def set_direct(self, name: str, value: Any) -> None:
         """Directly set a device attribute bypassing the staging."""
-        # Throw if trying to create an attribute
-        if not hasattr(self._device, name):
-            raise AttributeError(f"Cannot set attribute '{name}'")
-
-        # Check if it's a property and has a setter
-        device_attr = getattr(type(self._device), name, None)
-        if isinstance(device_attr, property) and device_attr.fset is None:
-            raise AttributeError(f"Cannot set read-only property '{name}'")
+        self._check_writable(name)
 
         setattr(self._device, name, value)
+        self._invalidate()
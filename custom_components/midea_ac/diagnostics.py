@@ -51,5 +51,14 @@ async def async_get_config_entry_diagnostics(
 
             # Dump supported features
             **feature_info
-        }
+        },
+        "poll_schedule": coordinator.poll_schedule,
+        "poll_preemption": coordinator.poll_preemption,
+        "circuit_breaker": coordinator.circuit_breaker,
+        "group_requests": coordinator.group_requests,
+        "refresh_tiers": coordinator.refresh_tiers,
+        "suppressed_writes": device.suppressed_writes,
+        "timings": coordinator.timings.as_dict(),
+        "connection_rotations": coordinator.connection_rotations,
+        "endpoint": coordinator.endpoint.as_dict() if coordinator.endpoint else None,
     }
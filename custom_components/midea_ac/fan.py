@@ -43,6 +43,7 @@ class MideaFreshAirFan(MideaCoordinatorEntity, FanEntity):
     """Fresh air (ventilation) fan for Midea AC."""
 
     _attr_translation_key = "fresh_air"
+    _dependencies = frozenset({"fresh_air_fan_speed", "power_state"})
     _enable_turn_on_off_backwards_compatibility = False
 
     # List of selectablespeed levels excluding off
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import logging
+from typing import Any, Mapping
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import CONF_FAN_SPEED_STEP, DOMAIN
@@ -40,6 +41,8 @@ class MideaFanSpeedNumber(MideaCoordinatorEntity, NumberEntity):
     """Fan speed number for Midea AC."""
 
     _attr_translation_key = "fan_speed"
+    _dependencies = frozenset({"fan_speed", "power_state"})
+    _follows_options = True
 
     def __init__(self,
                  coordinator: MideaDeviceUpdateCoordinator,
@@ -49,6 +52,12 @@ class MideaFanSpeedNumber(MideaCoordinatorEntity, NumberEntity):
 
         self._step_size = step_size
 
+    @callback
+    def _handle_options_update(self, options: Mapping[str, Any]) -> None:
+        """Update the step size from changed options."""
+        self._step_size = options.get(CONF_FAN_SPEED_STEP, 1)
+        self.async_write_ha_state()
+
     @property
     def device_info(self) -> dict:
         """Return info for device registry."""
@@ -92,6 +92,7 @@ class MideaEnumSelect(MideaCoordinatorEntity, SelectEntity):
         MideaCoordinatorEntity.__init__(self, coordinator)
 
         self._prop = prop
+        self._dependencies = frozenset({prop, "power_state"})
         self._enum_class = enum_class
         self._attr_translation_key = translation_key if translation_key is not None else prop
         self._options = options
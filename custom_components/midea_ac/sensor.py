@@ -2,30 +2,42 @@
 from __future__ import annotations
 
 import logging
+from typing import Any, Mapping
 
 from homeassistant.components.sensor import (SensorDeviceClass, SensorEntity,
                                              SensorStateClass)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (DEGREE, PERCENTAGE, REVOLUTIONS_PER_MINUTE,
-                                 UnitOfElectricCurrent,
+                                 EntityCategory, UnitOfElectricCurrent,
                                  UnitOfElectricPotential, UnitOfEnergy,
                                  UnitOfFrequency, UnitOfPower,
-                                 UnitOfTemperature)
-from homeassistant.core import HomeAssistant
+                                 UnitOfTemperature, UnitOfTime)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from msmart.utils import MideaIntEnum
 
 from .const import (CONF_ENERGY_DATA_FORMAT, CONF_ENERGY_DATA_SCALE,
                     CONF_ENERGY_SENSOR, CONF_POWER_SENSOR, DOMAIN,
-                    EnergyFormat)
+                    CircuitState, RefreshTier, TimingMetric)
 from .coordinator import (MideaCoordinatorEntity, MideaDeviceUpdateCoordinator,
                           MideaGroup1Entity, MideaGroup2Entity,
-                          MideaGroup5Entity, MideaGroup7Entity,
-                          MideaGroup11Entity)
+                          MideaGroup4Entity, MideaGroup5Entity,
+                          MideaGroup7Entity, MideaGroup11Entity)
+from .device_proxy import MideaDeviceProxy
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _get_energy_config(device: MideaDeviceProxy, options: Mapping[str, Any],
+                       key: str) -> tuple[MideaIntEnum, float]:
+    """Return the data format and scale of an energy sensor option."""
+    config = options.get(key)
+    format = device.EnergyDataFormat.get_from_name(
+        config.get(CONF_ENERGY_DATA_FORMAT).upper())
+    scale = config.get(CONF_ENERGY_DATA_SCALE)
+    return format, scale
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -68,20 +80,14 @@ async def async_setup_entry(
 
     # Only add energy sensors if device supports energy requests
     if hasattr(device, "enable_energy_usage_requests"):
-        def _get_energy_config(key: str) -> tuple[EnergyFormat, float]:
-            config = config_entry.options.get(key)
-            format = device.EnergyDataFormat.get_from_name(
-                config.get(CONF_ENERGY_DATA_FORMAT).upper())
-            scale = config.get(CONF_ENERGY_DATA_SCALE)
-            return format, scale
-
         # Configure energy format
         energy_data_format, energy_scale = _get_energy_config(
-            CONF_ENERGY_SENSOR)
+            device, config_entry.options, CONF_ENERGY_SENSOR)
         _LOGGER.info(
             "Using energy format %r (scale: %f) for device ID %s.", energy_data_format, energy_scale, coordinator.device.id)
 
-        power_data_format, power_scale = _get_energy_config(CONF_POWER_SENSOR)
+        power_data_format, power_scale = _get_energy_config(
+            device, config_entry.options, CONF_POWER_SENSOR)
         _LOGGER.info(
             "Using power format %r (scale: %f) for device ID %s.", power_data_format, power_scale, coordinator.device.id)
 
@@ -96,6 +102,7 @@ async def async_setup_entry(
                     "total_energy_usage",
                     format=energy_data_format,
                     scale=energy_scale,
+                    option=CONF_ENERGY_SENSOR,
                     state_class=SensorStateClass.TOTAL,
                 ),
                 MideaEnergySensor(
@@ -106,6 +113,7 @@ async def async_setup_entry(
                     "current_energy_usage",
                     format=energy_data_format,
                     scale=energy_scale,
+                    option=CONF_ENERGY_SENSOR,
                     state_class=SensorStateClass.TOTAL_INCREASING,
                 ),
                 MideaEnergySensor(
@@ -116,6 +124,8 @@ async def async_setup_entry(
                     "real_time_power_usage",
                     format=power_data_format,
                     scale=power_scale,
+                    option=CONF_POWER_SENSOR,
+                    tier=RefreshTier.FAST,
                 )
             ])
 
@@ -184,6 +194,10 @@ async def async_setup_entry(
                 entities.append(MideaGroup11Sensor(
                     coordinator, prop, device_class, unit, translation_key))
 
+    # Diagnostic sensor of device response times
+    entities.append(MideaTimingSensor(coordinator))
+    entities.append(MideaCircuitBreakerSensor(coordinator))
+
     add_entities(entities)
 
 
@@ -197,11 +211,12 @@ class MideaSensor(MideaCoordinatorEntity, SensorEntity):
                  unit: str | None,
                  translation_key: str | None = None,
                  *,
-                 state_class: SensorStateClass = SensorStateClass.MEASUREMENT,
+                 state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT,
                  ) -> None:
         MideaCoordinatorEntity.__init__(self, coordinator)
 
         self._prop = prop
+        self._dependencies = frozenset({prop})
         self._device_class = device_class
         self._state_class = state_class
         self._unit = unit
@@ -231,7 +246,7 @@ class MideaSensor(MideaCoordinatorEntity, SensorEntity):
         """Check entity availability."""
 
         # Sensor is unavailable if device is offline or value is None
-        return super().available and self.native_value is not None
+        return super().available and self.coordinator.published_value(self._prop) is not None
 
     @property
     def device_class(self) -> str:
@@ -254,51 +269,68 @@ class MideaSensor(MideaCoordinatorEntity, SensorEntity):
         return getattr(self._device, self._prop, None)
 
 
-class MideaEnergySensor(MideaSensor):
+class MideaEnergySensor(MideaSensor, MideaGroup4Entity):
     """Energy sensor class for Midea AC."""
 
     def __init__(self,
                  *args,
                  format: MideaIntEnum,
                  scale: float = 1.0,
+                 tier: RefreshTier = RefreshTier.SLOW,
+                 option: str | None = None,
                  **kwargs) -> None:
         MideaSensor.__init__(self, *args, **kwargs)
 
         self._format = format
         self._scale = scale
+        self._tier = tier
+
+        # Option configuring the format and scale, followed without a reload
+        self._option = option
+        self._follows_options = option is not None
         self._attr_entity_registry_enabled_default = False
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        # Call super method to ensure lifecycle is properly handled
-        await super().async_added_to_hass()
+        # Scaled value memoized per generation of the coordinator's published state
+        self._memo_generation: int | None = None
+        self._memo_value: float | None = None
 
-        # Register energy sensor with coordinator
-        self.coordinator.register_energy_sensor()
+    @property
+    def available(self) -> bool:
+        """Check entity availability."""
+        return self.coordinator.available and self.native_value is not None
 
-    async def async_will_remove_from_hass(self) -> None:
-        """Run when entity will be removed from hass."""
-        # Call super method to ensure lifecycle is properly handled
-        await super().async_will_remove_from_hass()
+    @property
+    def _value(self) -> float | None:
+        """Return the unscaled value in the configured format."""
+        # The coordinator reads every format of energy properties once per refresh
+        values = self.coordinator.published_value(self._prop)
+        if values is None:
+            return None
 
-        # Unregister energy sensor with coordinator
-        self.coordinator.unregister_energy_sensor()
+        return values.get(self._format)
 
     @property
     def native_value(self) -> float | None:
         """Return the scaled native value."""
-        # Manually prepend 'get_' to the property.
-        # This is so we don't have to change prop which causes unique ids to change
-        get_method = getattr(self._device, f"get_{self._prop}", None)
-        if get_method and callable(get_method):
-            value = get_method(self._format)
-        else:
-            value = None
+        # Availability, state and recorder all read the value, so compute it once per generation
+        generation = self.coordinator.generation
+        if generation != self._memo_generation:
+            value = self._value
+            self._memo_value = value * self._scale if value is not None else None
+            self._memo_generation = generation
 
-        if value is None:
-            return None
+        return self._memo_value
 
-        return value * self._scale
+    @callback
+    def _handle_options_update(self, options: Mapping[str, Any]) -> None:
+        """Update the format and scale from changed options."""
+        assert self._option is not None
+        self._format, self._scale = _get_energy_config(
+            self._device, options, self._option)
+
+        # Discard the value computed with the old format and scale
+        self._memo_generation = None
+        self.async_write_ha_state()
 
 
 class MideaGroup5Sensor(MideaSensor, MideaGroup5Entity):
@@ -352,3 +384,98 @@ class MideaGroup11Sensor(MideaSensor, MideaGroup11Entity):
 
         # Group 11 sensors start disabled in case device doesn't support them
         self._attr_entity_registry_enabled_default = False
+
+
+class MideaTimingSensor(MideaSensor):
+    """Diagnostic sensor of device refresh latency."""
+
+    def __init__(self, coordinator: MideaDeviceUpdateCoordinator) -> None:
+        MideaSensor.__init__(self,
+                             coordinator,
+                             "refresh_latency",
+                             SensorDeviceClass.DURATION,
+                             UnitOfTime.MILLISECONDS,
+                             "refresh_latency")
+
+        # Update on every refresh
+        self._dependencies = None
+
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+
+    @property
+    def available(self) -> bool:
+        """Check entity availability."""
+        return self.coordinator.available and self.native_value is not None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median refresh latency."""
+        value = self.coordinator.timings.histogram(
+            TimingMetric.REFRESH).percentile(.5)
+        if value is None:
+            return None
+
+        return round(value * 1000, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | int | None]:
+        """Return the latency percentiles of each operation."""
+        timings = self.coordinator.timings
+
+        attributes: dict[str, float | int | None] = {
+            "lock_contended": timings.contended}
+        for metric in TimingMetric:
+            histogram = timings.histogram(metric)
+            for name, fraction in (("p50", .5), ("p95", .95)):
+                value = histogram.percentile(fraction)
+                attributes[f"{metric}_{name}"] = (
+                    round(value * 1000, 1) if value is not None else None)
+
+        return attributes
+
+
+class MideaCircuitBreakerSensor(MideaSensor):
+    """Diagnostic sensor of the circuit breaker backing off polls of an unreachable device."""
+
+    def __init__(self, coordinator: MideaDeviceUpdateCoordinator) -> None:
+        MideaSensor.__init__(self,
+                             coordinator,
+                             "circuit_breaker",
+                             SensorDeviceClass.ENUM,
+                             None,
+                             "circuit_breaker",
+                             state_class=None)
+
+        # Only update on availability changes and breaker state changes
+        self._dependencies = frozenset()
+
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_options = list(CircuitState)
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+
+        self.async_on_remove(self.coordinator.async_add_circuit_listener(
+            self.async_write_ha_state))
+
+    @property
+    def available(self) -> bool:
+        """Check entity availability."""
+        # Stay available while the device is unreachable, when the state matters
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return the state of the circuit breaker."""
+        return self.coordinator.circuit_state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the consecutive failures and time until the next probe."""
+        breaker = self.coordinator.circuit_breaker
+        return {
+            "failures": breaker["failures"],
+            "retry_in": breaker["retry_in"],
+        }
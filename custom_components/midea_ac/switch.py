@@ -74,6 +74,7 @@ class MideaDisplaySwitch(MideaCoordinatorEntity, SwitchEntity):
     """Display switch for Midea AC."""
 
     _attr_translation_key = "display"
+    _dependencies = frozenset({"display_on"})
 
     def __init__(self, coordinator: MideaDeviceUpdateCoordinator) -> None:
         MideaCoordinatorEntity.__init__(self, coordinator)
@@ -138,6 +139,7 @@ class MideaSwitch(MideaCoordinatorEntity, SwitchEntity):
         MideaCoordinatorEntity.__init__(self, coordinator)
 
         self._prop = prop
+        self._dependencies = frozenset({prop, "power_state"})
         self._entity_category = entity_category
         self._attr_translation_key = translation_key if translation_key is not None else prop
         self._state_map = state_map
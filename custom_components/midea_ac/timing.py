@@ -0,0 +1,122 @@
+"""Lightweight timing instrumentation for Midea Smart AC."""
+from __future__ import annotations
+
+import bisect
+import time
+from collections import deque
+from typing import Any
+
+from .const import TIMING_BUCKETS, TIMING_WINDOW, TimingMetric
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest rank percentile of sorted samples."""
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+class MideaTimingHistogram:
+    """Rolling window of timing samples."""
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._total = 0
+
+    def record(self, seconds: float) -> None:
+        """Add a sample to the window."""
+        self._samples.append(seconds)
+        self._total += 1
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return a percentile of the window in seconds, or None if empty."""
+        if not self._samples:
+            return None
+
+        return _percentile(sorted(self._samples), fraction)
+
+    def summary(self) -> dict[str, Any]:
+        """Return the statistics and bucket counts of the window in milliseconds."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"total": self._total, "samples": 0}
+
+        def _ms(seconds: float) -> float:
+            return round(seconds * 1000, 1)
+
+        # Count samples less than or equal to each bucket bound
+        buckets = {f"le_{_ms(bound):g}": bisect.bisect_right(samples, bound)
+                   for bound in TIMING_BUCKETS}
+        buckets["le_inf"] = len(samples)
+
+        return {
+            "total": self._total,
+            "samples": len(samples),
+            "min": _ms(samples[0]),
+            "p50": _ms(_percentile(samples, .5)),
+            "p95": _ms(_percentile(samples, .95)),
+            "max": _ms(samples[-1]),
+            "buckets": buckets,
+        }
+
+
+class _Timer:
+    """Context manager recording the elapsed time to a histogram."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: MideaTimingHistogram) -> None:
+        self._histogram: MideaTimingHistogram | None = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> _Timer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self._histogram is not None:
+            self._histogram.record(time.perf_counter() - self._start)
+
+    def cancel(self) -> None:
+        """Discard the measurement."""
+        self._histogram = None
+
+
+class MideaTimings:
+    """Per device timing histograms of hot path operations.
+
+    Measurements are always recorded so diagnostics have data. Timing is
+    cheap next to the network requests being measured.
+    """
+
+    def __init__(self) -> None:
+        self._histograms = {metric: MideaTimingHistogram()
+                            for metric in TimingMetric}
+        self._contended = 0
+
+    def measure(self, metric: TimingMetric) -> _Timer:
+        """Return a context manager timing a metric."""
+        # Create a timer each time since it might be cancelled
+        return _Timer(self._histograms[metric])
+
+    def record(self, metric: TimingMetric, seconds: float) -> None:
+        """Record a sample."""
+        self._histograms[metric].record(seconds)
+
+    def record_contention(self) -> None:
+        """Record that a lock acquisition had to wait."""
+        self._contended += 1
+
+    @property
+    def contended(self) -> int:
+        """Return the number of lock acquisitions that had to wait."""
+        return self._contended
+
+    def histogram(self, metric: TimingMetric) -> MideaTimingHistogram:
+        """Return the histogram of a metric."""
+        return self._histograms[metric]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the lock contention and summaries of all metrics."""
+        return {
+            "lock_contended": self.contended,
+            **{metric: histogram.summary() for metric, histogram in self._histograms.items()},
+        }
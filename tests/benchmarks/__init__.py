@@ -0,0 +1 @@
+"""Benchmarks for Midea Smart AC."""
@@ -0,0 +1,96 @@
+"""Benchmarks of the coordinator and entities against emulated devices.
+
+Benchmarks aren't collected by default. Run them explicitly with:
+    pytest -s tests/benchmarks/bench_coordinator.py
+"""
+
+import asyncio
+import time
+
+import pytest
+from homeassistant.components.climate import (ATTR_TEMPERATURE,
+                                              SERVICE_SET_TEMPERATURE)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+from custom_components.midea_ac.const import DOMAIN
+
+from ..emulator import start_emulators, stop_emulators
+from .common import (LoopLagMonitor, async_setup_entries, async_unload_entries,
+                     entity_ids, percentiles, report)
+
+# Emulated network conditions
+_LATENCY = .02
+_JITTER = .01
+
+# Duration of the polling benchmark in seconds
+_POLL_DURATION = 5
+
+# Number of applies per device in the apply benchmark
+_APPLIES = 5
+
+
+@pytest.mark.parametrize("count", [1, 10, 100])
+async def test_benchmark_polling(hass: HomeAssistant, count: int) -> None:
+    """Measure poll throughput and event loop lag with devices polled back to back."""
+    emulators = await start_emulators(
+        count, latency=_LATENCY, jitter=_JITTER, seed=0)
+    entries = await async_setup_entries(hass, emulators)
+    coordinators = [hass.data[DOMAIN][e.entry_id] for e in entries]
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _POLL_DURATION
+    polls = 0
+
+    async def _poll(coordinator) -> None:
+        nonlocal polls
+        while loop.time() < deadline:
+            await coordinator.async_refresh()
+            polls += 1
+
+    async with LoopLagMonitor() as lag:
+        start = time.perf_counter()
+        await asyncio.gather(*(_poll(c) for c in coordinators))
+        elapsed = time.perf_counter() - start
+
+    report(f"polling[{count}]",
+           polls_per_second=round(polls / elapsed, 1),
+           loop_lag_ms=percentiles(lag.samples))
+
+    assert all(c.last_update_success for c in coordinators)
+
+    await async_unload_entries(hass, entries)
+    await stop_emulators(emulators)
+
+
+@pytest.mark.parametrize("count", [1, 10, 100])
+async def test_benchmark_apply(hass: HomeAssistant, count: int) -> None:
+    """Measure the latency of climate service calls through to the device."""
+    emulators = await start_emulators(
+        count, latency=_LATENCY, jitter=_JITTER, seed=0)
+    entries = await async_setup_entries(hass, emulators)
+    climate_ids = [entity_ids(hass, e, "climate")[0] for e in entries]
+
+    samples = []
+
+    async def _apply(entity_id: str) -> None:
+        for i in range(_APPLIES):
+            start = time.perf_counter()
+            await hass.services.async_call(
+                "climate",
+                SERVICE_SET_TEMPERATURE,
+                {ATTR_ENTITY_ID: entity_id, ATTR_TEMPERATURE: 20 + i},
+                blocking=True,
+            )
+            samples.append(time.perf_counter() - start)
+
+    async with LoopLagMonitor() as lag:
+        await asyncio.gather(*(_apply(e) for e in climate_ids))
+
+    report(f"apply[{count}]",
+           apply_latency_ms=percentiles(samples),
+           loop_lag_ms=percentiles(lag.samples),
+           device_writes=sum(e.requests[0x40] for e in emulators))
+
+    await async_unload_entries(hass, entries)
+    await stop_emulators(emulators)
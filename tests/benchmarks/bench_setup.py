@@ -0,0 +1,56 @@
+"""Benchmarks of integration setup against emulated devices.
+
+Benchmarks aren't collected by default. Run them explicitly with:
+    pytest -s tests/benchmarks/bench_setup.py
+"""
+
+import time
+import tracemalloc
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.midea_ac.const import DOMAIN
+
+from ..emulator import start_emulators, stop_emulators
+from .common import async_setup_entries, async_unload_entries, report
+
+# Emulated network conditions
+_LATENCY = .02
+_JITTER = .01
+
+
+@pytest.mark.parametrize("count", [1, 10, 100, 500])
+async def test_benchmark_setup(hass: HomeAssistant, count: int) -> None:
+    """Measure wall time, peak memory and entities created setting up N config entries."""
+    emulators = await start_emulators(
+        count, latency=_LATENCY, jitter=_JITTER, seed=0)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    entries = await async_setup_entries(hass, emulators)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    registry = er.async_get(hass)
+    entities = [e for e in registry.entities.values()
+                if e.platform == DOMAIN]
+    enabled = [e for e in entities if not e.disabled]
+
+    report(f"setup[{count}]",
+           wall_time_s=round(elapsed, 3),
+           per_entry_ms=round(elapsed / count * 1000, 2),
+           peak_memory_mb=round(peak / 1024 / 1024, 2),
+           entities=len(entities),
+           enabled_entities=len(enabled),
+           states=len(hass.states.async_all()))
+
+    assert all(e.state == ConfigEntryState.LOADED for e in entries)
+
+    await async_unload_entries(hass, entries)
+    await stop_emulators(emulators)
@@ -0,0 +1,102 @@
+"""Shared helpers for benchmarks against emulated devices."""
+from __future__ import annotations
+
+import asyncio
+import statistics
+
+from homeassistant.const import CONF_HOST, CONF_ID, CONF_PORT, CONF_TOKEN
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.midea_ac.const import CONF_DEVICE_TYPE, CONF_KEY, DOMAIN
+
+from ..emulator import MideaDeviceEmulator
+
+
+async def async_setup_entries(hass: HomeAssistant,
+                              emulators: list[MideaDeviceEmulator]) -> list[MockConfigEntry]:
+    """Create and set up a config entry for each emulated device."""
+    entries = []
+    for emulator in emulators:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            unique_id=str(emulator.device_id),
+            data={
+                CONF_ID: str(emulator.device_id),
+                CONF_HOST: emulator.host,
+                CONF_PORT: emulator.port,
+                CONF_TOKEN: None,
+                CONF_KEY: None,
+                CONF_DEVICE_TYPE: emulator.device_type,
+            }
+        )
+        entry.add_to_hass(hass)
+        entries.append(entry)
+
+    # Set up the integration and all entries like at startup
+    assert await async_setup_component(hass, DOMAIN, {})
+    await hass.async_block_till_done()
+
+    return entries
+
+
+async def async_unload_entries(hass: HomeAssistant, entries: list[MockConfigEntry]) -> None:
+    """Unload all config entries."""
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def entity_ids(hass: HomeAssistant, entry: MockConfigEntry, domain: str) -> list[str]:
+    """Return the entity IDs of a platform created for a config entry."""
+    registry = er.async_get(hass)
+    return [e.entity_id for e in er.async_entries_for_config_entry(registry, entry.entry_id)
+            if e.domain == domain]
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Return the median, 95th and 99th percentile of samples in milliseconds."""
+    if len(samples) < 2:
+        samples = samples * 2
+
+    quantiles = statistics.quantiles(samples, n=100)
+    return {
+        "p50": round(quantiles[49] * 1000, 2),
+        "p95": round(quantiles[94] * 1000, 2),
+        "p99": round(quantiles[98] * 1000, 2),
+    }
+
+
+def report(name: str, **metrics) -> None:
+    """Print the metrics of a benchmark."""
+    print(f"\n{name}: " + ", ".join(f"{k}={v}" for k, v in metrics.items()))
+
+
+class LoopLagMonitor:
+    """Measure event loop lag by timing a periodic sleep."""
+
+    def __init__(self, interval: float = .01) -> None:
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.samples: list[float] = []
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(0, loop.time() - start - self._interval))
+
+    async def __aenter__(self) -> LoopLagMonitor:
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        assert self._task is not None
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,236 @@
+"""Local LAN emulator of Midea AC and CC devices for testing and benchmarking."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections import Counter
+from typing import cast
+
+from msmart import crc8
+from msmart.const import DeviceType, FrameType
+from msmart.frame import Frame
+from msmart.lan import ProtocolError, _Packet
+
+_LOGGER = logging.getLogger(__name__)
+
+# V2 packet header size and offset of the packet length
+_PACKET_HEADER_LENGTH = 40
+_PACKET_LENGTH_OFFSET = 4
+
+
+def _frame(device_type: DeviceType, payload: bytes) -> bytes:
+    """Build a response frame from a payload."""
+    return Frame(device_type, FrameType.QUERY).tobytes(
+        payload + bytes([crc8.calculate(payload)]))
+
+
+# Canned AC responses captured from real devices or synthesized by msmart's tests
+_AC_STATE = bytes.fromhex(
+    "aa23ac00000000000303c00145660000003c0010045c6b20000000000000000000020d79")
+_AC_PROPERTIES = bytes.fromhex(
+    "aa21ac00000000000303b10409000001000a00000100150000012b1e020000005fa3")
+_AC_CAPABILITIES = [
+    _frame(DeviceType.AIR_CONDITIONER, bytes.fromhex(
+        "b50a12020101430001011402010115020101160201001a020101100201011f020103250207203c203c203c05400001000100")),
+    _frame(DeviceType.AIR_CONDITIONER, bytes.fromhex(
+        "b5051e020101130201012202010019020100390001010000")),
+]
+_AC_GROUPS = {
+    1: _frame(DeviceType.AIR_CONDITIONER, bytes.fromhex("c100004123240004e600482e8c4a370000000000")),
+    2: _frame(DeviceType.AIR_CONDITIONER, bytes.fromhex("c100004234350000100000000000000000000000")),
+    4: bytes.fromhex("aa20ac00000000000203c121014400564a02640000000014ae0000000000041a22"),
+    5: bytes.fromhex("aa20ac00000000000303c12101453f546c005d0a000000de1f0000ba9a0004af9c"),
+    7: _frame(DeviceType.AIR_CONDITIONER, bytes.fromhex("c10000470000000000000d010000000000000000")),
+    11: _frame(DeviceType.AIR_CONDITIONER, bytes.fromhex("c100004b0064006400486400f000000000000000")),
+}
+
+# Canned CC query response
+_CC_QUERY = bytes.fromhex(
+    "aa63cc0000000000000301fe00000043005001728c79010100728c728c797900010141ff010203000603010000000300000001030103010000000000000000000001000100010000000000000000000000000001000200000100000101000102ff02ff6a")
+
+
+class _EmulatorProtocol(asyncio.Protocol):
+    """Protocol handling a single client connection to an emulated device."""
+
+    def __init__(self, emulator: MideaDeviceEmulator) -> None:
+        self._emulator = emulator
+        self._transport: asyncio.Transport | None = None
+        self._buffer = bytearray()
+        self._requests = 0
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = cast(asyncio.Transport, transport)
+        self._emulator.connections += 1
+        self._emulator._protocols.add(self)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+        self._emulator._protocols.discard(self)
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._transport:
+            self._transport.close()
+
+    def data_received(self, data: bytes) -> None:
+        self._buffer += data
+
+        # Extract complete packets from the stream
+        while len(self._buffer) >= _PACKET_HEADER_LENGTH:
+            length = int.from_bytes(
+                self._buffer[_PACKET_LENGTH_OFFSET:_PACKET_LENGTH_OFFSET + 2], "little")
+            if len(self._buffer) < length:
+                break
+
+            packet = bytes(self._buffer[:length])
+            del self._buffer[:length]
+            self._handle_packet(packet)
+
+    def _handle_packet(self, packet: bytes) -> None:
+        emulator = self._emulator
+        self._requests += 1
+
+        # Drop the connection on schedule like devices that limit connection lifetime
+        if emulator.disconnect_after and self._requests > emulator.disconnect_after:
+            emulator.disconnects += 1
+            self.close()
+            return
+
+        try:
+            request = _Packet.decode(packet)
+        except ProtocolError as e:
+            _LOGGER.warning("Emulator received invalid packet: %s", e)
+            return
+
+        response = emulator.respond(request)
+        if response is None:
+            return
+
+        # Simulate packet loss
+        if emulator.packet_loss and emulator.random.random() < emulator.packet_loss:
+            emulator.dropped += 1
+            return
+
+        # Delay the response by the configured latency
+        loop = asyncio.get_running_loop()
+        loop.call_later(emulator.delay(), self._write,
+                        _Packet.encode(emulator.device_id, response))
+
+    def _write(self, data: bytes) -> None:
+        if self._transport and not self._transport.is_closing():
+            self._transport.write(data)
+
+
+class MideaDeviceEmulator:
+    """Emulated Midea AC or CC device speaking the V2 LAN protocol."""
+
+    def __init__(self,
+                 device_type: DeviceType = DeviceType.AIR_CONDITIONER,
+                 device_id: int = 0,
+                 *,
+                 latency: float = 0,
+                 jitter: float = 0,
+                 packet_loss: float = 0,
+                 disconnect_after: int | None = None,
+                 seed: int | None = None) -> None:
+        self.device_type = device_type
+        self.device_id = device_id
+
+        # Response latency and uniformly distributed jitter in seconds
+        self.latency = latency
+        self.jitter = jitter
+
+        # Probability a response is lost
+        self.packet_loss = packet_loss
+
+        # Number of requests after which each connection is dropped
+        self.disconnect_after = disconnect_after
+
+        self.random = random.Random(seed)
+
+        # Statistics
+        self.requests: Counter[int] = Counter()
+        self.connections = 0
+        self.disconnects = 0
+        self.dropped = 0
+
+        self._server: asyncio.Server | None = None
+        self._protocols: set[_EmulatorProtocol] = set()
+
+    @property
+    def host(self) -> str:
+        """Return the host the emulator is listening on."""
+        assert self._server is not None, "Emulator not started."
+        return self._server.sockets[0].getsockname()[0]
+
+    @property
+    def port(self) -> int:
+        """Return the port the emulator is listening on."""
+        assert self._server is not None, "Emulator not started."
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Start listening for connections. Use an ephemeral port by default."""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _EmulatorProtocol(self), host, port)
+
+    async def stop(self) -> None:
+        """Stop listening and close all connections."""
+        if self._server is None:
+            return
+
+        self._server.close()
+        for protocol in list(self._protocols):
+            protocol.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    def delay(self) -> float:
+        """Return the delay of the next response."""
+        return max(0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+
+    def respond(self, frame: bytes) -> bytes | None:
+        """Return the response frame to a request frame, or None to not respond."""
+        if len(frame) < 12:
+            return None
+
+        request_id = frame[10]
+        self.requests[request_id] += 1
+
+        if self.device_type == DeviceType.COMMERCIAL_AC:
+            # Queries and controls are answered with the device state
+            return _CC_QUERY
+
+        if request_id == 0x41:
+            # Group data requests share the state request ID
+            if frame[11] == 0x21:
+                return _AC_GROUPS.get(frame[13] & 0xF)
+
+            return _AC_STATE
+
+        if request_id == 0x40:
+            return _AC_STATE
+
+        if request_id == 0xB5:
+            # Second request fetches additional capabilities
+            return _AC_CAPABILITIES[1 if frame[12] else 0]
+
+        if request_id in (0xB0, 0xB1):
+            return _AC_PROPERTIES
+
+        return None
+
+
+async def start_emulators(count: int, **kwargs) -> list[MideaDeviceEmulator]:
+    """Start a number of emulated devices on ephemeral ports."""
+    emulators = [MideaDeviceEmulator(device_id=i, **kwargs)
+                 for i in range(count)]
+    await asyncio.gather(*(e.start() for e in emulators))
+    return emulators
+
+
+async def stop_emulators(emulators: list[MideaDeviceEmulator]) -> None:
+    """Stop a number of emulated devices."""
+    await asyncio.gather(*(e.stop() for e in emulators))
@@ -1,8 +1,9 @@
 """Tests for the climate platform."""
 
+import datetime
 import logging
 from enum import Flag
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 from homeassistant.components.climate.const import (PRESET_AWAY, PRESET_BOOST,
@@ -10,16 +11,23 @@ from homeassistant.components.climate.const import (PRESET_AWAY, PRESET_BOOST,
                                                     PRESET_SLEEP,
                                                     ClimateEntityFeature,
                                                     HVACMode)
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.util import dt as dt_util
 from msmart.device import AirConditioner as AC
 from msmart.device import CommercialAirConditioner as CC
 from msmart.utils import MideaIntEnum
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry, async_fire_time_changed)
 
 from custom_components.midea_ac.climate import (ClimateConfig,
                                                 MideaClimateACDevice,
                                                 MideaClimateCCDevice,
                                                 MideaClimateDevice)
-from custom_components.midea_ac.const import PRESET_IECO, PRESET_SILENT
+from custom_components.midea_ac.const import (ADAPTIVE_UPDATE_INTERVAL_MAX,
+                                              CONF_ADAPTIVE_POLLING, DOMAIN,
+                                              PRESET_IECO, PRESET_SILENT)
 
 logging.basicConfig(level=logging.DEBUG)
 _LOGGER = logging.getLogger(__name__)
@@ -299,3 +307,50 @@ async def test_preset_mode_requires_capability(
         # Assert device doesnt report preset mode when its inactive
         setattr(mock_device, attr, False)
         assert climate_device.preset_mode != preset
+
+
+async def test_climate_entity_polling(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the climate entity leaves polling to the coordinator so adaptive polling can back off."""
+
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={CONF_ADAPTIVE_POLLING: True})
+
+    with (patch("custom_components.midea_ac.config_flow.AC.get_capabilities"),
+          patch("custom_components.midea_ac.config_flow.AC.refresh"),
+          patch("custom_components.midea_ac.config_flow.AC.online",
+                new_callable=PropertyMock(return_value=True))):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+        # Verify the climate entity is attached and doesn't poll on its own
+        entities = [entity
+                    for platform in async_get_platforms(hass, DOMAIN)
+                    if platform.domain == Platform.CLIMATE
+                    for entity in platform.entities.values()]
+        assert len(entities) == 1
+        assert entities[0].should_poll is False
+
+        # Back off the unchanged device to the maximum interval
+        for _ in range(3):
+            await coordinator.async_refresh()
+        assert coordinator.update_interval.total_seconds() == ADAPTIVE_UPDATE_INTERVAL_MAX
+
+        # Verify nothing forces a refresh at the entity scan interval
+        with patch.object(coordinator, "async_request_refresh") as request_refresh_mock:
+            async_fire_time_changed(
+                hass, dt_util.utcnow() + datetime.timedelta(seconds=61))
+            await hass.async_block_till_done()
+
+            request_refresh_mock.assert_not_called()
+
+        # Verify the interval stays backed off
+        assert coordinator.update_interval.total_seconds() == ADAPTIVE_UPDATE_INTERVAL_MAX
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
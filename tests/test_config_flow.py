@@ -1,6 +1,7 @@
 """Tests for the config flow."""
 
 import logging
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
@@ -157,6 +158,117 @@ async def test_discover_flow_new_and_already_configured_devices(
     assert mock_existing_device.id not in device_ids
 
 
+async def test_discover_flow_multiple_targets(
+    hass: HomeAssistant,
+    create_mock_device
+) -> None:
+    """Test the discover flow searches each host and network and merges the devices found."""
+    mock_device = create_mock_device(1234, "10.0.0.40", "net_ac_1234")
+    mock_remote_device = create_mock_device(5678, "10.0.1.2", "net_ac_5678")
+
+    async def _discover(target, **kwargs):
+        if target == "10.0.0.40":
+            return [mock_device]
+        if target == "10.0.1.2":
+            return [mock_remote_device]
+        if target == "10.0.1.1":
+            raise OSError("Network is unreachable")
+        return []
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "discover"}
+    )
+    assert result
+
+    with patch(
+        "custom_components.midea_ac.config_flow.Discover.discover",
+        side_effect=_discover
+    ) as mock_discover:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={CONF_HOST: "10.0.0.40, 10.0.1.0/30 10.0.0.40"}
+        )
+
+    # Check each target is searched once despite duplicates
+    targets = [call.kwargs["target"] for call in mock_discover.call_args_list]
+    assert sorted(targets) == ["10.0.0.40", "10.0.1.1", "10.0.1.2"]
+
+    # Check devices of all reachable targets are offered
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "pick_device"
+
+    device_ids = result["data_schema"].schema[CONF_ID].container.keys()
+    assert mock_device.id in device_ids
+    assert mock_remote_device.id in device_ids
+
+
+async def test_discover_flow_broadcast_target(
+    hass: HomeAssistant,
+    create_mock_device
+) -> None:
+    """Test the discover flow lets the user pick when a single broadcast address finds several devices."""
+    mock_device = create_mock_device(1234, "192.168.20.40", "net_ac_1234")
+    mock_other_device = create_mock_device(
+        5678, "192.168.20.41", "net_ac_5678")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "discover"}
+    )
+    assert result
+
+    with patch(
+        "custom_components.midea_ac.config_flow.Discover.discover",
+        new_callable=AsyncMock,
+        return_value=[mock_device, mock_other_device]
+    ) as mock_discover:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={CONF_HOST: "192.168.20.255"}
+        )
+
+    # Check the broadcast address is searched once
+    mock_discover.assert_awaited_once()
+    assert mock_discover.await_args.kwargs["target"] == "192.168.20.255"
+
+    # Check all devices that answered are offered
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "pick_device"
+
+    device_ids = result["data_schema"].schema[CONF_ID].container.keys()
+    assert mock_device.id in device_ids
+    assert mock_other_device.id in device_ids
+
+
+@pytest.mark.parametrize(
+    "host",
+    ["10.0.0.0/33", "10.0.0.0/8", "not_a_network/24"]
+)
+async def test_discover_flow_invalid_network(
+    hass: HomeAssistant,
+    host: str
+) -> None:
+    """Test the discover flow rejects invalid or too large networks."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "discover"}
+    )
+    assert result
+
+    with patch(
+        "custom_components.midea_ac.config_flow.Discover.discover",
+        new_callable=AsyncMock,
+    ) as mock_discover:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={CONF_HOST: host}
+        )
+
+    mock_discover.assert_not_awaited()
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "discover"
+    assert result["errors"] == {"base": "invalid_network"}
+
+
 def test_cloud_country_codes_are_known_to_msmart() -> None:
     """Test every selectable cloud region has credentials in msmart-ng."""
     assert set(CONF_CLOUD_COUNTRY_CODES) <= set(
@@ -205,20 +317,21 @@ async def test_discover_flow_uses_selected_region(
     )
     assert result
 
-    # Check cloud region is passed to discover_single method
+    # Check cloud region is passed to discover method of a specified host
     with patch(
-        "custom_components.midea_ac.config_flow.Discover.discover_single",
+        "custom_components.midea_ac.config_flow.Discover.discover",
         new_callable=AsyncMock,
-        return_value=None
-    ) as mock_discover_single:
+        return_value=[]
+    ) as mock_discover:
         await hass.config_entries.flow.async_configure(
             result["flow_id"],
             user_input={CONF_HOST: "10.0.0.41",
                         CONF_COUNTRY_CODE: country_code}
         )
 
-    mock_discover_single.assert_awaited_once()
-    kwargs = mock_discover_single.await_args.kwargs
+    mock_discover.assert_awaited_once()
+    kwargs = mock_discover.await_args.kwargs
+    assert kwargs["target"] == "10.0.0.41"
 
     # Region must be forwarded so msmart-ng selects the right credentials
     assert kwargs["region"] == country_code
@@ -710,6 +823,19 @@ async def test_options_flow_init(
         CONF_BEEP: False,
         CONF_UPDATE_INTERVAL: 20,
     }
+
+    # Assert options were applied without a reload
+    assert len(mock_setup_entry.mock_calls) == 0
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    assert coordinator.update_interval == timedelta(seconds=20)
+
+    # Assert capability overrides still reload the entry
+    with patch("custom_components.midea_ac.async_setup_entry",
+               return_value=True) as mock_setup_entry:
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={**mock_config_entry.options, CONF_CAPABILITY_OVERRIDES: "supported_modes: []"})
+        await hass.async_block_till_done()
+
     assert len(mock_setup_entry.mock_calls) == 1
 
 
@@ -0,0 +1,258 @@
+"""Tests for the connection manager."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from msmart.device import AirConditioner as AC
+from msmart.device import CommercialAirConditioner as CC
+
+from custom_components.midea_ac.connection import (MideaConnectionManager,
+                                                   get_connection_manager,
+                                                   rotation_delay,
+                                                   set_connection_lifetime)
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_connection_manager_endpoints(
+    hass: HomeAssistant
+) -> None:
+    """Test devices at the same host and port share an endpoint."""
+    manager = MideaConnectionManager(hass)
+
+    endpoint = manager.acquire("10.0.0.1", 6444, "a")
+    assert manager.acquire("10.0.0.1", 6444, "b") is endpoint
+    assert endpoint.members == 2
+
+    # Verify other hosts and ports get separate endpoints
+    assert manager.acquire("10.0.0.1", 6445, "c") is not endpoint
+    assert manager.acquire("10.0.0.2", 6444, "d") is not endpoint
+
+    # Verify endpoints are discarded once unused
+    manager.release("10.0.0.1", 6444, "a")
+    assert endpoint.members == 1
+    manager.release("10.0.0.1", 6444, "b")
+    assert manager.acquire("10.0.0.1", 6444, "a") is not endpoint
+
+    # Verify releasing an unknown endpoint is harmless
+    manager.release("10.0.0.3", 6444, "a")
+
+
+async def test_endpoint_serializes_devices(
+    hass: HomeAssistant
+) -> None:
+    """Test requests of devices sharing an endpoint don't overlap."""
+    manager = get_connection_manager(hass)
+    endpoint = manager.acquire("0.0.0.0", 0, "a")
+    manager.acquire("0.0.0.0", 0, "b")
+
+    # Create dummy devices and coordinators behind the same endpoint
+    devices = [CC("0.0.0.0", 0, 0), CC("0.0.0.0", 0, 1)]
+    coordinators = [MideaDeviceUpdateCoordinator(hass, device, endpoint=endpoint)
+                    for device in devices]
+
+    active = 0
+    overlapped = False
+
+    async def _refresh() -> None:
+        nonlocal active, overlapped
+        active += 1
+        overlapped |= active > 1
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    with (patch.object(devices[0], "refresh", side_effect=_refresh),
+          patch.object(devices[1], "refresh", side_effect=_refresh)):
+        await asyncio.gather(*(c._async_update_data() for c in coordinators))
+
+    assert not overlapped
+    assert endpoint.as_dict() == {"members": 2, "contended": 1}
+
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+
+async def test_connection_manager_sessions(
+    hass: HomeAssistant
+) -> None:
+    """Test parked sessions are only reused with unchanged credentials."""
+    manager = get_connection_manager(hass)
+    assert get_connection_manager(hass) is manager
+
+    device = AC("0.0.0.0", 0, 0)
+    credentials = (0xAC, "0.0.0.0", 0, "0", "token", "key")
+
+    # Verify a parked session is claimed once
+    manager.park_session("a", credentials, device)
+    assert manager.claim_session("a", credentials) is device
+    assert manager.claim_session("a", credentials) is None
+
+    # Verify sessions with changed credentials are discarded
+    manager.park_session("a", credentials, device)
+    with patch.object(device._lan, "_disconnect") as disconnect_mock:
+        assert manager.claim_session(
+            "a", (0xAC, "0.0.0.0", 0, "0", "other", "key")) is None
+    disconnect_mock.assert_called_once()
+    assert manager.claim_session("a", credentials) is None
+
+    # Verify parked sessions are closed when Home Assistant stops
+    manager.park_session("a", credentials, device)
+    with patch.object(device._lan, "_disconnect") as disconnect_mock:
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+    disconnect_mock.assert_called_once()
+    assert manager.claim_session("a", credentials) is None
+
+
+async def test_rotation_delay() -> None:
+    """Test connections are rotated a margin before they expire."""
+    device = AC("0.0.0.0", 0, 0)
+
+    # Verify nothing is rotated without a connection
+    assert rotation_delay(device) is None
+    assert rotation_delay(MagicMock()) is None
+
+    # Verify connections without a lifetime aren't rotated
+    device._lan._protocol = MagicMock()
+    assert rotation_delay(device) is None
+
+    device.set_max_connection_lifetime(90)
+    device._lan._connection_expiration = datetime.now(
+        timezone.utc) + timedelta(seconds=60)
+    assert 49 < rotation_delay(device) <= 50
+
+    # Verify the margin is limited for short lifetimes
+    device.set_max_connection_lifetime(15)
+    assert 54 < rotation_delay(device) <= 55
+
+    # Verify expired connections are rotated immediately
+    device._lan._connection_expiration = datetime.now(timezone.utc)
+    assert rotation_delay(device) == 0
+
+    # Verify a stale expiration isn't rotated once the lifetime is cleared
+    device.set_max_connection_lifetime(None)
+    assert rotation_delay(device) is None
+
+
+async def test_set_connection_lifetime() -> None:
+    """Test changing the connection lifetime replaces the connection."""
+    device = AC("0.0.0.0", 0, 0)
+    device._lan._protocol = protocol = MagicMock()
+    expiration = device._lan._connection_expiration = datetime.now(
+        timezone.utc) + timedelta(seconds=60)
+
+    # Verify an unchanged lifetime keeps the connection
+    set_connection_lifetime(device, None)
+    protocol.disconnect.assert_not_called()
+    assert device._lan._connection_expiration == expiration
+
+    # Verify a changed lifetime closes the connection and its expiration
+    set_connection_lifetime(device, 90)
+    protocol.disconnect.assert_called_once()
+    assert device._lan._protocol is None
+    assert device._lan._connection_expiration is None
+    assert device._lan.max_connection_lifetime == 90
+
+
+async def test_coordinator_rotates_connection(
+    hass: HomeAssistant
+) -> None:
+    """Test the coordinator replaces connections ahead of expiration."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with (patch.object(device, "refresh"),
+          patch("custom_components.midea_ac.coordinator.rotation_delay",
+                return_value=0) as delay_mock,
+          patch("custom_components.midea_ac.coordinator.async_rotate_connection") as rotate_mock):
+        # Verify a request schedules the rotation of an expiring connection
+        rotate_mock.side_effect = lambda _: setattr(
+            delay_mock, "return_value", None)
+        await coordinator._async_update_data()
+        await hass.async_block_till_done()
+
+        rotate_mock.assert_awaited_once_with(device)
+        assert coordinator.connection_rotations == 1
+
+        # Verify nothing is scheduled once the connection is fresh
+        assert coordinator._unsub_rotation is None
+
+        # Verify a rotation leaving the connection due isn't retried in a loop
+        rotate_mock.reset_mock()
+        rotate_mock.side_effect = None
+        delay_mock.return_value = 0
+        await coordinator._async_rotate_connection()
+        await hass.async_block_till_done()
+
+        rotate_mock.assert_awaited_once_with(device)
+        assert coordinator._unsub_rotation is None
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_set_connection_lifetime(
+    hass: HomeAssistant
+) -> None:
+    """Test clearing the connection lifetime of a live device closes its connection."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    device.set_max_connection_lifetime(90)
+    device._lan._protocol = protocol = MagicMock()
+    device._lan._connection_expiration = datetime.now(timezone.utc)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    # Verify the connection and its stale expiration are discarded
+    await coordinator.async_set_connection_lifetime(None)
+    protocol.disconnect.assert_called_once()
+    assert device._lan._connection_expiration is None
+    assert device._lan.max_connection_lifetime is None
+    assert coordinator._unsub_rotation is None
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_defers_rotation_for_writes(
+    hass: HomeAssistant
+) -> None:
+    """Test the coordinator doesn't rotate connections while a write is pending."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with (patch.object(device, "refresh"),
+          patch.object(device, "apply") as apply_mock,
+          patch("custom_components.midea_ac.coordinator.rotation_delay",
+                return_value=0) as delay_mock,
+          patch("custom_components.midea_ac.coordinator.async_rotate_connection") as rotate_mock):
+        rotate_mock.side_effect = lambda _: setattr(
+            delay_mock, "return_value", None)
+
+        # Start a write
+        coordinator.device.target_temperature = 20
+        apply = hass.async_create_task(coordinator.apply())
+        await asyncio.sleep(0)
+
+        # Verify a rotation due while the write is pending is skipped
+        await coordinator._async_rotate_connection()
+        rotate_mock.assert_not_awaited()
+
+        # Verify the rotation is rescheduled once the write completes
+        await apply
+        apply_mock.assert_awaited_once()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+        rotate_mock.assert_awaited_once_with(device)
+        assert coordinator.connection_rotations == 1
+
+    await coordinator.async_shutdown()
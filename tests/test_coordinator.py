@@ -1,18 +1,24 @@
 """Tests for the data update coordinator."""
 
 import asyncio
+import datetime
 import logging
 from typing import NoReturn
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
 from msmart.device import AirConditioner as AC
 from msmart.lan import _LanProtocol
 
 from custom_components.midea_ac.binary_sensor import (MideaGroup2BinarySensor,
                                                       MideaGroup5BinarySensor)
-from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+from custom_components.midea_ac.const import (CircuitState, RefreshTier,
+                                              TimingMetric)
+from custom_components.midea_ac.coordinator import (
+    MideaCircuitBreaker, MideaDeviceUpdateCoordinator,
+    MideaGroupRequestPlanner, MideaPollScheduler)
 from custom_components.midea_ac.sensor import (MideaGroup1Sensor,
                                                MideaGroup2Sensor,
                                                MideaGroup5Sensor,
@@ -81,8 +87,9 @@ async def test_concurrent_network_access_exception(
             refresh_task = asyncio.create_task(
                 coordinator.async_request_refresh())
 
-            # Start concurrent apply()
+            # Start concurrent apply() with a change so the device is written
             await asyncio.sleep(.5)
+            coordinator.device.target_temperature = 20
             await coordinator.apply()
 
             # Wait for refresh to finish
@@ -109,8 +116,9 @@ async def test_concurrent_network_access_with_lock(
     # Check that concurrent calls to network actions don't throw when protected with a lock
     refresh_task = asyncio.create_task(coordinator.async_request_refresh())
 
-    # Start concurrent apply()
+    # Start concurrent apply() with a change so the device is written
     await asyncio.sleep(.5)
+    coordinator.device.target_temperature = 20
     await coordinator.apply()
 
     # Wait for refresh to finish
@@ -227,17 +235,17 @@ async def test_group5_entity_request_enable(
         await entity.async_added_to_hass()
 
     # Verify group 5 requests are enabled when entity is added to HA
-    assert coordinator._group5_entities == len(entities)
+    assert coordinator._group_planner.subscribers(5) == len(entities)
     assert device.enable_group5_data_requests == True
 
     # Remove 1 entity from HA
     await entities[0].async_will_remove_from_hass()
-    assert coordinator._group5_entities == 1
+    assert coordinator._group_planner.subscribers(5) == 1
     assert device.enable_group5_data_requests == True
 
     # Verify group 5 requests are disabled when last entity is removed
     await entities[1].async_will_remove_from_hass()
-    assert coordinator._group5_entities == 0
+    assert coordinator._group_planner.subscribers(5) == 0
     assert device.enable_group5_data_requests == False
 
     await coordinator.async_shutdown()
@@ -268,12 +276,12 @@ async def test_group1_entity_request_enable(
         await entity.async_added_to_hass()
 
     # Verify group 1 requests are enabled when entity is added to HA
-    assert coordinator._group1_entities == len(entities)
+    assert coordinator._group_planner.subscribers(1) == len(entities)
     assert device.enable_group1_data_requests == True
 
     # Remove 1 entity from HA
     await entities[0].async_will_remove_from_hass()
-    assert coordinator._group1_entities == 0
+    assert coordinator._group_planner.subscribers(1) == 0
     assert device.enable_group1_data_requests == False
 
     await coordinator.async_shutdown()
@@ -310,17 +318,17 @@ async def test_group2_entity_request_enable(
         await entity.async_added_to_hass()
 
     # Verify group 2 requests are enabled when entity is added to HA
-    assert coordinator._group2_entities == len(entities)
+    assert coordinator._group_planner.subscribers(2) == len(entities)
     assert device.enable_group2_data_requests == True
 
     # Remove 1 entity from HA
     await entities[0].async_will_remove_from_hass()
-    assert coordinator._group2_entities == 1
+    assert coordinator._group_planner.subscribers(2) == 1
     assert device.enable_group2_data_requests == True
 
     # Verify group 2 requests are disabled when last entity is removed
     await entities[1].async_will_remove_from_hass()
-    assert coordinator._group2_entities == 0
+    assert coordinator._group_planner.subscribers(2) == 0
     assert device.enable_group2_data_requests == False
 
     await coordinator.async_shutdown()
@@ -351,12 +359,12 @@ async def test_group7_entity_request_enable(
         await entity.async_added_to_hass()
 
     # Verify group 7 requests are enabled when entity is added to HA
-    assert coordinator._group7_entities == len(entities)
+    assert coordinator._group_planner.subscribers(7) == len(entities)
     assert device.enable_group7_data_requests == True
 
     # Remove 1 entity from HA
     await entities[0].async_will_remove_from_hass()
-    assert coordinator._group7_entities == 0
+    assert coordinator._group_planner.subscribers(7) == 0
     assert device.enable_group7_data_requests == False
 
     await coordinator.async_shutdown()
@@ -387,12 +395,610 @@ async def test_group11_entity_request_enable(
         await entity.async_added_to_hass()
 
     # Verify group 11 requests are enabled when entity is added to HA
-    assert coordinator._group11_entities == len(entities)
+    assert coordinator._group_planner.subscribers(11) == len(entities)
     assert device.enable_group11_data_requests == True
 
     # Remove 1 entity from HA
     await entities[0].async_will_remove_from_hass()
-    assert coordinator._group11_entities == 0
+    assert coordinator._group_planner.subscribers(11) == 0
     assert device.enable_group11_data_requests == False
 
     await coordinator.async_shutdown()
+
+
+async def test_poll_scheduler_phases() -> None:
+    """Test the poll scheduler spreads members evenly across the interval."""
+
+    scheduler = MideaPollScheduler()
+    for key in ["a", "b", "c", "d"]:
+        scheduler.register(key)
+
+    # Verify phases are spread evenly
+    assert scheduler.phases == {"a": 0, "b": .25, "c": .5, "d": .75}
+
+    # Verify phases are rebalanced when a member leaves
+    scheduler.unregister("b")
+    assert scheduler.phases == {"a": 0, "c": 1/3, "d": 2/3}
+
+    # Verify next refresh lands on the member's phase grid
+    assert scheduler.next_refresh("a", 100, 15) == 120
+    assert scheduler.next_refresh("c", 100, 15) == 110
+    assert scheduler.next_refresh("d", 100, 15) == 115
+
+    # Verify next refresh is at least half an interval away
+    assert scheduler.next_refresh("c", 104, 15) == 125
+
+
+async def test_coordinator_poll_schedule(
+    hass: HomeAssistant
+) -> None:
+    """Test coordinators are assigned distinct poll phases."""
+
+    # Create dummy devices and coordinators
+    coordinators = [
+        MideaDeviceUpdateCoordinator(hass, AC("0.0.0.0", 0, id))
+        for id in range(3)
+    ]
+
+    # Verify each coordinator has a unique phase
+    phases = {c.poll_schedule["phase"] for c in coordinators}
+    assert len(phases) == len(coordinators)
+
+    # Verify coordinators leave the schedule on shutdown
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+    assert coordinators[0].poll_schedule["assignments"] == {}
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant
+) -> None:
+    """Test adaptive polling backs off while state is unchanged."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass, device, update_interval=15, adaptive=True)
+    device._online = True
+
+    with (patch.object(device, "refresh"), patch.object(device, "apply")):
+        # Initial refresh uses the configured interval
+        await coordinator._async_update_data()
+        assert coordinator.update_interval.total_seconds() == 15
+
+        # Verify interval backs off to the cap while state is unchanged
+        for interval in [30, 60, 120, 120]:
+            await coordinator._async_update_data()
+            assert coordinator.update_interval.total_seconds() == interval
+
+        # Verify a state change returns to the configured interval
+        device.target_temperature = 26
+        await coordinator._async_update_data()
+        assert coordinator.update_interval.total_seconds() == 15
+
+        # Back off again and verify apply returns to the configured interval
+        await coordinator._async_update_data()
+        assert coordinator.update_interval.total_seconds() == 30
+
+        coordinator.device.target_temperature = 24
+        await coordinator.apply()
+        assert coordinator.update_interval.total_seconds() == 15
+
+    await coordinator.async_shutdown()
+
+
+async def test_update_listeners_changed_properties(
+    hass: HomeAssistant
+) -> None:
+    """Test listeners are only updated when their dependent properties change."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    # Add listeners with and without dependencies
+    temperature_listener = MagicMock()
+    power_listener = MagicMock()
+    any_listener = MagicMock()
+    unsubscribes = [
+        coordinator.async_add_listener(
+            temperature_listener, frozenset({"target_temperature"})),
+        coordinator.async_add_listener(
+            power_listener, frozenset({"power_state"})),
+        coordinator.async_add_listener(any_listener),
+    ]
+
+    def _reset_listeners() -> None:
+        for listener in [temperature_listener, power_listener, any_listener]:
+            listener.reset_mock()
+
+    device._online = True
+
+    with patch.object(device, "refresh"):
+        # Verify all listeners are notified on initial refresh
+        await coordinator.async_refresh()
+        temperature_listener.assert_called_once()
+        power_listener.assert_called_once()
+        any_listener.assert_called_once()
+
+        # Verify only listeners without dependencies are notified if nothing changed
+        _reset_listeners()
+        await coordinator.async_refresh()
+        temperature_listener.assert_not_called()
+        power_listener.assert_not_called()
+        any_listener.assert_called_once()
+
+        # Verify only dependent listeners are notified of changes
+        _reset_listeners()
+        device.target_temperature = 26
+        await coordinator.async_refresh()
+        temperature_listener.assert_called_once()
+        power_listener.assert_not_called()
+        any_listener.assert_called_once()
+
+        # Verify availability changes notify all listeners
+        _reset_listeners()
+        device._online = False
+        await coordinator.async_refresh()
+        temperature_listener.assert_called_once()
+        power_listener.assert_called_once()
+        any_listener.assert_called_once()
+
+    # Verify the listener index is cleaned up
+    assert set(coordinator._property_listeners) == {
+        "target_temperature", "power_state"}
+
+    for unsubscribe in unsubscribes:
+        unsubscribe()
+
+    assert coordinator._property_listeners == {}
+    assert coordinator._unindexed_listeners == {}
+
+    await coordinator.async_shutdown()
+
+
+async def test_available_after_failed_refresh(
+    hass: HomeAssistant
+) -> None:
+    """Test the device is unavailable while updates fail."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    with patch.object(device, "refresh") as refresh_mock:
+        await coordinator.async_refresh()
+        assert coordinator.available
+
+        # Verify a failed update makes the device unavailable
+        refresh_mock.side_effect = TimeoutError
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert not coordinator.available
+
+        # Verify a successful update restores availability
+        refresh_mock.side_effect = None
+        await coordinator.async_refresh()
+        assert coordinator.available
+
+    await coordinator.async_shutdown()
+
+
+async def test_apply_coalesces_writes(
+    hass: HomeAssistant
+) -> None:
+    """Test concurrent applies are merged into a single write and refresh."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    async def _set_and_apply(name, value) -> None:
+        setattr(coordinator.device, name, value)
+        await coordinator.apply()
+
+    with (patch.object(device, "apply") as apply_mock,
+          patch.object(coordinator, "async_request_refresh") as refresh_mock):
+        # Apply a burst of changes
+        await asyncio.gather(
+            _set_and_apply("target_temperature", 20),
+            _set_and_apply("fan_speed", AC.FanSpeed.HIGH),
+            _set_and_apply("power_state", True),
+        )
+
+        # Verify a single write and refresh were made with all changes
+        apply_mock.assert_awaited_once()
+        refresh_mock.assert_awaited_once()
+        assert device.target_temperature == 20
+        assert device.fan_speed == AC.FanSpeed.HIGH
+        assert device.power_state is True
+
+        # Verify applies outside the window are written separately
+        await _set_and_apply("target_temperature", 22)
+        assert apply_mock.await_count == 2
+        assert device.target_temperature == 22
+
+        # Verify a follow-up apply with nothing staged isn't counted as suppressed
+        await coordinator.apply()
+        assert apply_mock.await_count == 2
+        assert coordinator.device.suppressed_writes == 0
+
+    await coordinator.async_shutdown()
+
+
+async def test_apply_optimistic_state(
+    hass: HomeAssistant
+) -> None:
+    """Test optimistic applies publish state immediately and verify it on the next poll."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass, device, optimistic=True, apply_window=0)
+
+    listener = MagicMock()
+    unsubscribe = coordinator.async_add_listener(
+        listener, frozenset({"target_temperature"}))
+
+    with (patch.object(device, "refresh"),
+          patch.object(device, "apply") as apply_mock,
+          patch.object(coordinator, "async_request_refresh") as refresh_mock):
+        await coordinator.async_refresh()
+        listener.reset_mock()
+
+        # Verify applied state is published without a refresh
+        coordinator.device.target_temperature = 20
+        await coordinator.apply()
+        apply_mock.assert_awaited_once()
+        refresh_mock.assert_not_awaited()
+        listener.assert_called_once()
+        listener.reset_mock()
+
+        # Verify a poll confirming the applied state doesn't update listeners
+        await coordinator.async_refresh()
+        listener.assert_not_called()
+
+        # Verify a poll reporting a different value rolls back the state
+        device.target_temperature = 24
+        await coordinator.async_refresh()
+        listener.assert_called_once()
+
+    unsubscribe()
+    await coordinator.async_shutdown()
+
+
+async def test_group_request_planner() -> None:
+    """Test the group request planner only requests subscribed groups when due."""
+
+    planner = MideaGroupRequestPlanner({
+        RefreshTier.FAST: 0,
+        RefreshTier.NORMAL: 60,
+        RefreshTier.SLOW: 300,
+    })
+
+    # Verify groups without subscribers are never due
+    assert planner.due(0) == set()
+
+    planner.subscribe(7, RefreshTier.FAST)
+    planner.subscribe(11, RefreshTier.NORMAL)
+    planner.subscribe(11, RefreshTier.NORMAL)
+    assert planner.subscribers(11) == 2
+
+    # Verify new subscriptions are due immediately
+    assert planner.due(0) == {7, 11}
+    planner.mark_requested({7, 11}, 0)
+
+    # Verify groups are due according to their tier
+    assert planner.due(15) == {7}
+    planner.mark_requested({7}, 15)
+    assert planner.due(59.5) == {7, 11}
+
+    # Verify groups are due until successfully requested
+    assert planner.due(75) == {7, 11}
+
+    # Verify groups are only inactive once all subscribers leave
+    planner.unsubscribe(11, RefreshTier.NORMAL)
+    assert planner.active == {7, 11}
+    planner.unsubscribe(11, RefreshTier.NORMAL)
+    assert planner.active == {7}
+
+
+async def test_group_request_planner_tiers() -> None:
+    """Test a group is requested at the fastest tier of its subscribers."""
+
+    planner = MideaGroupRequestPlanner({
+        RefreshTier.FAST: 0,
+        RefreshTier.NORMAL: 60,
+        RefreshTier.SLOW: 300,
+    })
+
+    planner.subscribe(4, RefreshTier.SLOW)
+    assert planner.tier(4) == RefreshTier.SLOW
+    planner.mark_requested({4}, 0)
+    assert planner.due(120) == set()
+
+    # Verify a faster subscriber speeds up the group
+    planner.subscribe(4, RefreshTier.FAST)
+    assert planner.tier(4) == RefreshTier.FAST
+    assert planner.due(120) == {4}
+
+    # Verify the group slows down when the faster subscriber leaves
+    planner.unsubscribe(4, RefreshTier.FAST)
+    assert planner.tier(4) == RefreshTier.SLOW
+    assert planner.due(120) == set()
+
+
+async def test_group_requests_refresh(
+    hass: HomeAssistant
+) -> None:
+    """Test group data requests follow their cadence across refreshes."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    coordinator.register_group_entity(7)
+    coordinator.register_group_entity(11, RefreshTier.NORMAL)
+    device._online = True
+
+    with patch.object(device, "refresh"):
+        # Verify all subscribed groups are requested initially
+        await coordinator._async_update_data()
+        assert device.enable_group7_data_requests == True
+        assert device.enable_group11_data_requests == True
+
+        # Verify slower groups are skipped until due
+        await coordinator._async_update_data()
+        assert device.enable_group7_data_requests == True
+        assert device.enable_group11_data_requests == False
+
+        # Verify slower groups are requested once due
+        coordinator._group_planner.mark_requested(
+            {11}, hass.loop.time() - 60)
+        await coordinator._async_update_data()
+        assert device.enable_group11_data_requests == True
+
+    # Verify diagnostics report the planner state
+    assert coordinator.group_requests[11] == {
+        "subscribers": 1, "tier": RefreshTier.NORMAL}
+
+    tiers = coordinator.refresh_tiers
+    assert tiers[RefreshTier.FAST]["groups"] == [7]
+    assert tiers[RefreshTier.FAST]["requests_per_hour"] == 240
+    assert tiers[RefreshTier.NORMAL]["groups"] == [11]
+    assert tiers[RefreshTier.NORMAL]["requests_per_hour"] == 60
+    assert tiers[RefreshTier.SLOW]["groups"] == []
+
+    coordinator.unregister_group_entity(7)
+    assert device.enable_group7_data_requests == False
+
+    await coordinator.async_shutdown()
+
+
+async def test_timings(
+    hass: HomeAssistant
+) -> None:
+    """Test timing instrumentation of device requests."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device, apply_window=0)
+    timings = coordinator.timings
+
+    with (patch.object(device, "refresh") as refresh_mock,
+          patch.object(device, "apply"),
+          patch.object(coordinator, "async_request_refresh")):
+        # Verify refreshes, writes and lock waits are recorded
+        await coordinator._async_update_data()
+        coordinator.device.target_temperature = 20
+        await coordinator.apply()
+        assert timings.histogram(
+            TimingMetric.REFRESH).percentile(.5) is not None
+        assert timings.as_dict()[TimingMetric.REFRESH]["samples"] == 1
+        assert timings.as_dict()[TimingMetric.APPLY]["samples"] == 1
+        assert timings.as_dict()[TimingMetric.LOCK_WAIT]["samples"] == 2
+
+        # Verify skipped writes aren't recorded
+        coordinator.device.target_temperature = 20
+        await coordinator.apply()
+        assert timings.as_dict()[TimingMetric.APPLY]["samples"] == 1
+
+        # Verify contended lock acquisitions are counted
+        async def _slow_refresh() -> None:
+            await asyncio.sleep(0)
+
+        refresh_mock.side_effect = _slow_refresh
+        await asyncio.gather(coordinator._async_update_data(),
+                             coordinator._async_update_data())
+        assert timings.contended == 1
+
+    await coordinator.async_shutdown()
+
+
+async def test_apply_preempts_poll(
+    hass: HomeAssistant
+) -> None:
+    """Test writes preempt polls before group data requests and pending writes drop new polls."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device, apply_window=0)
+
+    # Request group data so each poll makes multiple refreshes
+    coordinator.register_group_entity(7)
+
+    # Setup a mock LAN protocol
+    _mock_lan_protocol(device._lan)
+    lan = device._lan
+
+    apply = None
+
+    async def _read(**kwargs) -> bytes:
+        nonlocal apply
+
+        # Start a write while the device state request is in flight
+        if apply is None:
+            coordinator.device.target_temperature = 20
+            apply = hass.async_create_task(coordinator.apply())
+
+        await asyncio.sleep(.1)
+        return b""
+
+    with (patch.object(lan, "_read", side_effect=_read) as read_mock,
+          patch.object(lan, "_disconnect", wraps=lan._disconnect) as disconnect_mock,
+          patch.object(device, "apply") as apply_mock,
+          patch.object(coordinator, "async_request_refresh")):
+        await coordinator._async_update_data()
+
+        # Verify the request in flight completed and the group data request was skipped
+        assert read_mock.await_count == 1
+        assert coordinator.poll_preemption == {"dropped": 0, "preempted": 1}
+
+        # Verify the skipped group data remains due
+        assert 7 in coordinator._group_planner.due(hass.loop.time())
+
+        # Verify the preempted poll left the connection open and the device online
+        disconnect_mock.assert_not_called()
+        assert lan._protocol is not None
+        assert device.online
+
+        # Verify the write proceeds once the request completed
+        await apply
+        apply_mock.assert_awaited_once()
+
+        # Verify polls are dropped while a write is pending
+        coordinator.device.target_temperature = 22
+        apply = hass.async_create_task(coordinator.apply())
+        await asyncio.sleep(0)
+        await coordinator._async_update_data()
+        assert coordinator.poll_preemption == {"dropped": 1, "preempted": 1}
+        await apply
+
+        # Verify a dropped poll doesn't recover a failed coordinator
+        coordinator.last_update_success = False
+        coordinator.device.target_temperature = 24
+        apply = hass.async_create_task(coordinator.apply())
+        await asyncio.sleep(0)
+        await coordinator.async_refresh()
+        assert coordinator.poll_preemption == {"dropped": 2, "preempted": 1}
+        assert not coordinator.last_update_success
+        await apply
+
+    await coordinator.async_shutdown()
+
+
+async def test_circuit_breaker() -> None:
+    """Test the circuit breaker opens, backs off and closes."""
+
+    breaker = MideaCircuitBreaker(10, threshold=3, max_delay=60)
+
+    # Verify the breaker stays closed below the threshold
+    assert breaker.record_failure(0) is None
+    assert breaker.record_failure(0) is None
+    assert breaker.state == CircuitState.CLOSED
+
+    # Verify the breaker opens at the threshold with jittered backoff
+    delay = breaker.record_failure(0)
+    assert 5 <= delay <= 10
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow(delay - 1)
+
+    # Verify a single probe is allowed once the backoff expires
+    assert breaker.allow(delay)
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # Verify a failed probe reopens with a longer backoff
+    delay = breaker.record_failure(100)
+    assert 10 <= delay <= 20
+    assert breaker.as_dict(100)["state"] == CircuitState.OPEN
+
+    # Verify the backoff is capped
+    for _ in range(10):
+        delay = breaker.record_failure(100)
+    assert 30 <= delay <= 60
+
+    # Verify success closes the breaker
+    assert breaker.record_success()
+    assert breaker.as_dict(100) == {
+        "state": CircuitState.CLOSED, "failures": 0, "retry_in": None}
+    assert not breaker.record_success()
+
+
+async def test_circuit_breaker_refresh(
+    hass: HomeAssistant
+) -> None:
+    """Test polls of an unreachable device are skipped while the breaker is open."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+    coordinator.register_group_entity(7)
+
+    async def _slow_refresh() -> None:
+        await asyncio.sleep(.2)
+
+    with (patch.object(device, "refresh", side_effect=_slow_refresh) as refresh_mock,
+          patch("custom_components.midea_ac.coordinator.random.uniform",
+                side_effect=lambda low, high: high)):
+        # Verify the breaker opens after consecutive failed polls
+        for _ in range(3):
+            await coordinator._async_update_data()
+        assert refresh_mock.await_count == 3
+        assert coordinator.circuit_breaker["state"] == CircuitState.OPEN
+        assert coordinator.circuit_state == CircuitState.OPEN
+
+        # Verify the backoff starts when the failed poll ended
+        retry_in = coordinator._circuit_breaker.retry_in(hass.loop.time())
+        assert retry_in > coordinator._circuit_breaker.base_delay - .1
+
+        # Verify polls are skipped while open and the update still fails
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert refresh_mock.await_count == 3
+
+        # Verify the half-open probe skips group data requests
+        coordinator._circuit_breaker._retry_at = 0
+        device._online = True
+        await coordinator._async_update_data()
+        assert refresh_mock.await_count == 4
+        assert device.enable_group7_data_requests == False
+
+        # Verify success closes the breaker and restores group requests
+        assert coordinator.circuit_breaker["state"] == CircuitState.CLOSED
+        await coordinator._async_update_data()
+        assert device.enable_group7_data_requests == True
+
+    await coordinator.async_shutdown()
+
+
+async def test_update_options(
+    hass: HomeAssistant
+) -> None:
+    """Test polling options and option listeners are updated in place."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(
+        hass, device, update_interval=15)
+
+    # Verify polling options are replaced
+    coordinator.async_set_polling(30, adaptive=True, optimistic=True)
+    assert coordinator.update_interval == datetime.timedelta(seconds=30)
+    assert coordinator.poll_schedule["adaptive"] is True
+    assert coordinator._optimistic is True
+    assert coordinator._circuit_breaker.base_delay == 30
+
+    # Verify option listeners are notified until removed
+    listener = MagicMock()
+    remove_listener = coordinator.async_add_options_listener(listener)
+    coordinator.async_update_options({"temp_step": 0.5})
+    listener.assert_called_once_with({"temp_step": 0.5})
+
+    remove_listener()
+    coordinator.async_update_options({"temp_step": 1.0})
+    listener.assert_called_once()
+
+    await coordinator.async_shutdown()
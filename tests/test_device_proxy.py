@@ -8,6 +8,7 @@ import pytest
 from msmart.device import AirConditioner as AC
 from msmart.device import CommercialAirConditioner as CC
 
+from custom_components.midea_ac.const import ApplyResult
 from custom_components.midea_ac.device_proxy import MideaDeviceProxy
 
 logging.basicConfig(level=logging.DEBUG)
@@ -114,3 +115,159 @@ async def test_device_proxy_hasattr() -> None:
         proxy, "enable_energy_usage_requests")
     assert hasattr(device, "fake_attribute") == hasattr(
         proxy, "fake_attribute")
+
+
+async def test_device_proxy_apply_unchanged() -> None:
+    """Test that applying unchanged values skips the device write"""
+
+    # Create dummy device
+    device = AC("0.0.0.0", 0, 0)
+    device.target_temperature = 25
+    device.power_state = True
+
+    # Create proxy
+    proxy = MideaDeviceProxy(device)
+
+    # Verify unchanged values are written while the device state is unconfirmed
+    proxy.target_temperature = 25
+    with patch("custom_components.midea_ac.config_flow.AC.apply") as apply_mock:
+        assert await proxy.apply() == ApplyResult.WRITTEN
+        apply_mock.assert_awaited_once()
+
+    # Refresh the device state
+    device._online = True
+    with patch("custom_components.midea_ac.config_flow.AC.refresh"):
+        await proxy.refresh()
+
+    # Stage values matching the current device state
+    proxy.target_temperature = 25
+    proxy.power_state = True
+
+    # Verify the write is skipped and counted
+    with patch("custom_components.midea_ac.config_flow.AC.apply") as apply_mock:
+        assert await proxy.apply() == ApplyResult.SUPPRESSED
+        apply_mock.assert_not_awaited()
+
+    assert proxy._staged == {}
+    assert proxy.suppressed_writes == 1
+
+    # Verify applying with nothing staged isn't counted as a skipped write
+    with patch("custom_components.midea_ac.config_flow.AC.apply") as apply_mock:
+        assert await proxy.apply() == ApplyResult.NOTHING_STAGED
+        apply_mock.assert_not_awaited()
+
+    assert proxy.suppressed_writes == 1
+
+    # Stage a mix of changed and unchanged values
+    proxy.target_temperature = 20
+    proxy.power_state = True
+
+    # Verify the write is made with the changed value
+    with patch("custom_components.midea_ac.config_flow.AC.apply") as apply_mock:
+        assert await proxy.apply() == ApplyResult.WRITTEN
+        apply_mock.assert_awaited_once()
+
+    assert device.target_temperature == 20
+    assert proxy.suppressed_writes == 1
+
+    # Verify unchanged values are written once the device state is stale,
+    # since a remote may have changed the device since it was read
+    proxy.target_temperature = 20
+    with (patch("custom_components.midea_ac.device_proxy.WRITE_SUPPRESSION_MAX_AGE", -1),
+          patch("custom_components.midea_ac.config_flow.AC.apply") as apply_mock):
+        assert await proxy.apply() == ApplyResult.WRITTEN
+        apply_mock.assert_awaited_once()
+
+    assert proxy.suppressed_writes == 1
+
+
+async def test_device_proxy_read() -> None:
+    """Test reading properties and values only available via getters"""
+
+    # Create dummy device
+    device = AC("0.0.0.0", 0, 0)
+    device.target_temperature = 25
+
+    # Create proxy
+    proxy = MideaDeviceProxy(device)
+
+    # Verify properties are read like attributes
+    assert proxy.read("target_temperature") == 25
+    assert proxy.read("some_nonexistent_attribute") is None
+
+    # Verify getters are resolved once from the device class
+    assert proxy._format_getters["real_time_power_usage"] == "get_real_time_power_usage"
+    assert "capabilities" not in proxy._format_getters
+
+    # Verify values only available via getters are read in every format
+    with patch.object(device, "get_real_time_power_usage", return_value=100) as getter_mock:
+        assert proxy.read("real_time_power_usage") == {
+            format: 100 for format in AC.EnergyDataFormat}
+        assert getter_mock.call_count == len(AC.EnergyDataFormat)
+
+
+async def test_device_proxy_snapshot() -> None:
+    """Test that property reads are snapshotted until the device state changes"""
+
+    # Create dummy device
+    device = AC("0.0.0.0", 0, 0)
+    device.target_temperature = 25
+
+    # Create proxy
+    proxy = MideaDeviceProxy(device)
+
+    # Verify the proxy has no instance dict
+    with pytest.raises(AttributeError):
+        object.__getattribute__(proxy, "__dict__")
+
+    # Verify reads are served from the snapshot
+    assert proxy.target_temperature == 25
+    assert proxy._snapshot["target_temperature"] == 25
+    device.target_temperature = 20
+    assert proxy.target_temperature == 25
+
+    # Verify a refresh discards the snapshot
+    with patch("custom_components.midea_ac.config_flow.AC.refresh"):
+        await proxy.refresh()
+    assert proxy.target_temperature == 20
+
+    # Verify device commands discard the snapshot
+    device.target_temperature = 22
+    with patch("custom_components.midea_ac.config_flow.AC.toggle_display"):
+        await proxy.toggle_display()
+    assert proxy.target_temperature == 22
+
+    # Verify direct writes discard the snapshot
+    proxy.set_direct("target_temperature", 24)
+    assert proxy.target_temperature == 24
+
+    # Verify methods and class attributes aren't snapshotted
+    assert proxy.get_total_energy_usage(
+        AC.EnergyDataFormat.BCD) == device.get_total_energy_usage(AC.EnergyDataFormat.BCD)
+    assert proxy.FanSpeed == AC.FanSpeed
+    assert "FanSpeed" not in proxy._snapshot
+
+
+async def test_device_proxy_bulk_stage() -> None:
+    """Test staging multiple changes at once"""
+
+    # Create dummy device and proxy
+    device = AC("0.0.0.0", 0, 0)
+    proxy = MideaDeviceProxy(device)
+
+    # Assert nothing is staged if any attribute can't be set
+    with pytest.raises(AttributeError, match="Cannot set read-only property"):
+        proxy.stage({"eco": True, "indoor_humidity": 2})
+    with pytest.raises(AttributeError, match="Cannot set attribute"):
+        proxy.stage({"eco": True, "some_nonexistent_attribute": 2})
+    assert proxy._staged == {}
+
+    # Assert all changes are staged
+    proxy.stage({"eco": True, "turbo": True})
+    assert proxy._staged == {"eco": True, "turbo": True}
+    assert proxy.eco is True
+    assert device.eco is False
+
+    # Assert direct writes are validated the same way
+    with pytest.raises(AttributeError, match="Cannot set read-only property"):
+        proxy.set_direct("indoor_humidity", 2)
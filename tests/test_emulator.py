@@ -0,0 +1,82 @@
+"""Tests for the device emulator."""
+
+from homeassistant.core import HomeAssistant
+from msmart.const import DeviceType
+from msmart.device import AirConditioner as AC
+from msmart.device import CommercialAirConditioner as CC
+
+from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
+
+from .emulator import MideaDeviceEmulator
+
+
+async def test_emulator_ac(
+    hass: HomeAssistant
+) -> None:
+    """Test the coordinator can query and control an emulated AC device."""
+
+    emulator = MideaDeviceEmulator(latency=.01)
+    await emulator.start()
+
+    device = AC(ip=emulator.host, port=emulator.port, device_id=0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device, apply_window=0)
+
+    # Verify capabilities and state are received
+    assert await coordinator.async_get_capabilities()
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert device.online
+    assert device.target_temperature == 21.0
+
+    # Verify changes are written to the device
+    coordinator.device.target_temperature = 24
+    await coordinator.apply()
+    assert emulator.requests[0x40] == 1
+
+    await coordinator.async_shutdown()
+    await emulator.stop()
+
+
+async def test_emulator_cc(
+    hass: HomeAssistant
+) -> None:
+    """Test the coordinator can query an emulated CC device."""
+
+    emulator = MideaDeviceEmulator(DeviceType.COMMERCIAL_AC)
+    await emulator.start()
+
+    device = CC(ip=emulator.host, port=emulator.port, device_id=0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert device.online
+    assert device.target_temperature == 20.5
+
+    await coordinator.async_shutdown()
+    await emulator.stop()
+
+
+async def test_emulator_disconnect(
+    hass: HomeAssistant
+) -> None:
+    """Test the emulator drops connections on schedule."""
+
+    emulator = MideaDeviceEmulator(disconnect_after=1)
+    await emulator.start()
+
+    device = AC(ip=emulator.host, port=emulator.port, device_id=0)
+
+    # Verify the second request on a connection is dropped
+    await device.refresh()
+    assert device.online
+    await device.refresh()
+    assert not device.online
+    assert emulator.disconnects == 1
+
+    # Verify the device reconnects
+    await device.refresh()
+    assert device.online
+    assert emulator.connections == 2
+
+    await emulator.stop()
@@ -1,26 +1,32 @@
 """Tests for the integration init."""
 
 import logging
+from datetime import datetime, timezone
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_HOST, CONF_ID, CONF_PORT, CONF_TOKEN
 from homeassistant.core import HomeAssistant
 from msmart.const import DeviceType
+from msmart.device import AirConditioner as AC
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.midea_ac.capability_cache import MideaCapabilityCache
 from custom_components.midea_ac.const import (CONF_ADDITIONAL_OPERATION_MODES,
                                               CONF_CAPABILITY_OVERRIDES,
                                               CONF_DEVICE_TYPE,
                                               CONF_ENERGY_DATA_FORMAT,
                                               CONF_ENERGY_DATA_SCALE,
-                                              CONF_ENERGY_SENSOR,
+                                              CONF_ENERGY_SENSOR, CONF_KEY,
+                                              CONF_MAX_CONNECTION_LIFETIME,
                                               CONF_POWER_SENSOR,
                                               CONF_SHOW_ALL_PRESETS,
                                               CONF_UPDATE_INTERVAL,
                                               CONF_USE_FAN_ONLY_WORKAROUND,
-                                              CONF_WORKAROUNDS, DOMAIN,
+                                              CONF_WORKAROUNDS,
+                                              DATA_STARTUP_SEMAPHORE, DOMAIN,
                                               UPDATE_INTERVAL, EnergyFormat)
 
 logging.basicConfig(level=logging.DEBUG)
@@ -384,3 +390,200 @@ async def test_unload_entry_platform_failure(
     # refresh timer doesn't linger past the end of the test.
     coordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
     await coordinator.async_shutdown()
+
+
+async def test_setup_entry_defers_capabilities(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test setup completes without a first refresh when the device doesn't respond."""
+
+    with (patch("custom_components.midea_ac.config_flow.AC.get_capabilities"),
+          patch("custom_components.midea_ac.config_flow.AC.refresh") as refresh_mock,
+          patch("custom_components.midea_ac.config_flow.AC.online",
+                new_callable=PropertyMock(return_value=False))):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        # Verify entry loaded without waiting for the device
+        assert mock_config_entry.state is ConfigEntryState.LOADED
+        refresh_mock.assert_not_awaited()
+
+        # Verify capabilities are retried in the background
+        assert len(mock_config_entry._background_tasks) == 1
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_setup_entry_first_refresh(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test setup refreshes the device when capabilities are discovered."""
+
+    with (patch("custom_components.midea_ac.config_flow.AC.get_capabilities"),
+          patch("custom_components.midea_ac.config_flow.AC.refresh") as refresh_mock,
+          patch("custom_components.midea_ac.config_flow.AC.online",
+                new_callable=PropertyMock(return_value=True))):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert mock_config_entry.state is ConfigEntryState.LOADED
+        refresh_mock.assert_awaited()
+        assert len(mock_config_entry._background_tasks) == 0
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_setup_entry_releases_startup_semaphore(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the startup semaphore is released before the first refresh."""
+
+    semaphore_locked = []
+
+    async def _refresh() -> None:
+        semaphore_locked.append(hass.data[DATA_STARTUP_SEMAPHORE].locked())
+
+    with (patch("custom_components.midea_ac.STARTUP_CONCURRENCY", 1),
+          patch("custom_components.midea_ac.config_flow.AC.get_capabilities"),
+          patch("custom_components.midea_ac.config_flow.AC.refresh",
+                side_effect=_refresh),
+          patch("custom_components.midea_ac.config_flow.AC.online",
+                new_callable=PropertyMock(return_value=True))):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        # Verify the first refresh didn't hold up other devices starting
+        assert mock_config_entry.state is ConfigEntryState.LOADED
+        assert semaphore_locked == [False]
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_reload_entry_reuses_session(
+    hass: HomeAssistant,
+) -> None:
+    """Test a reload reuses the authenticated device session."""
+
+    mock_config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="1234",
+        data={
+            CONF_ID: "1234",
+            CONF_HOST: "localhost",
+            CONF_PORT: 6444,
+            CONF_TOKEN: "00" * 64,
+            CONF_KEY: "00" * 32,
+            CONF_DEVICE_TYPE: 0xAC,
+        }
+    )
+
+    with (patch("custom_components.midea_ac.config_flow.AC.authenticate") as authenticate_mock,
+          patch("custom_components.midea_ac.config_flow.AC.get_capabilities"),
+          patch("custom_components.midea_ac.config_flow.AC.refresh"),
+          patch("custom_components.midea_ac.config_flow.AC.online",
+                new_callable=PropertyMock(return_value=True))):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        authenticate_mock.assert_awaited_once()
+        device = hass.data[DOMAIN][mock_config_entry.entry_id].device._device
+
+        # Verify the reload reuses the device without authenticating
+        await hass.config_entries.async_reload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert mock_config_entry.state is ConfigEntryState.LOADED
+        authenticate_mock.assert_awaited_once()
+        assert hass.data[DOMAIN][mock_config_entry.entry_id].device._device is device
+
+        # Verify a reused session doesn't keep the expiration of a changed lifetime
+        device._lan._protocol = MagicMock()
+        device._lan._connection_expiration = datetime.now(timezone.utc)
+        await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={CONF_MAX_CONNECTION_LIFETIME: 90})
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert hass.data[DOMAIN][mock_config_entry.entry_id].device._device is device
+        assert device._lan._protocol is None
+        assert device._lan._connection_expiration is None
+        assert device._lan.max_connection_lifetime == 90
+
+        # Verify changed credentials create a new session
+        await hass.config_entries.async_unload(mock_config_entry.entry_id)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, data={**mock_config_entry.data, CONF_TOKEN: "11" * 64})
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert authenticate_mock.await_count == 2
+        assert hass.data[DOMAIN][mock_config_entry.entry_id].device._device is not device
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_setup_entry_cached_capabilities(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test setup restores cached capabilities instead of querying the device."""
+
+    with (patch("custom_components.midea_ac.config_flow.AC.get_capabilities") as get_capabilities_mock,
+          patch("custom_components.midea_ac.config_flow.AC.refresh"),
+          patch("custom_components.midea_ac.config_flow.AC.online",
+                new_callable=PropertyMock(return_value=True))):
+        mock_config_entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        # Verify capabilities were queried on first setup
+        get_capabilities_mock.assert_awaited_once()
+        assert len(mock_config_entry._background_tasks) == 0
+
+        await hass.config_entries.async_reload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        # Verify cached capabilities were used and revalidated in the background
+        assert mock_config_entry.state is ConfigEntryState.LOADED
+        get_capabilities_mock.assert_awaited_once()
+        assert len(mock_config_entry._background_tasks) == 1
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_capability_cache_state(
+    hass: HomeAssistant,
+) -> None:
+    """Test the capability cache restores device state set by a capability query."""
+
+    cache = MideaCapabilityCache(hass)
+    await cache.async_load()
+
+    # Cache a device with a non-default iECO number
+    device = AC("0.0.0.0", 0, 1234)
+    device._ieco_number = 3
+
+    with patch.object(cache._store, "async_delay_save"):
+        assert cache.async_update(device)
+
+    # Verify the iECO number is restored with the capabilities
+    restored = AC("0.0.0.0", 0, 1234)
+    assert cache.restore(restored)
+    assert restored._ieco_number == 3
+
+    # Verify entries cached without the state aren't used
+    cache._data["1234"].pop("state")
+    assert not cache.restore(AC("0.0.0.0", 0, 1234))
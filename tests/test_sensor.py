@@ -1,12 +1,16 @@
 """Tests for the sensor platform."""
 
+from unittest.mock import MagicMock, patch
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfEnergy, UnitOfPower
 from homeassistant.core import HomeAssistant
 from msmart.device import AirConditioner as AC
 
+from custom_components.midea_ac.const import CircuitState, RefreshTier
 from custom_components.midea_ac.coordinator import MideaDeviceUpdateCoordinator
-from custom_components.midea_ac.sensor import MideaEnergySensor
+from custom_components.midea_ac.sensor import (MideaCircuitBreakerSensor,
+                                               MideaEnergySensor)
 
 
 async def test_energy_sensor_request_enable(
@@ -28,6 +32,7 @@ async def test_energy_sensor_request_enable(
             "real_time_power_usage",
             format=AC.EnergyDataFormat.BCD,
             scale=1.0,
+            tier=RefreshTier.FAST,
         ),
         MideaEnergySensor(
             coordinator,
@@ -46,17 +51,114 @@ async def test_energy_sensor_request_enable(
         await sensor.async_added_to_hass()
 
     # Verify energy requests are enabled when sensor is added to HA
-    assert coordinator._energy_sensors == len(sensors)
+    assert coordinator._group_planner.subscribers(4) == len(sensors)
     assert device.enable_energy_usage_requests == True
 
+    # Verify energy requests are made at the fastest subscribed tier
+    assert coordinator._group_planner.tier(4) == RefreshTier.FAST
+
     # Remove 1 sensor from HA
     await sensors[0].async_will_remove_from_hass()
-    assert coordinator._energy_sensors == 1
+    assert coordinator._group_planner.subscribers(4) == 1
     assert device.enable_energy_usage_requests == True
+    assert coordinator._group_planner.tier(4) == RefreshTier.SLOW
 
     # Verify energy requests are disabled when last sensor is removed
     await sensors[1].async_will_remove_from_hass()
-    assert coordinator._energy_sensors == 0
+    assert coordinator._group_planner.subscribers(4) == 0
     assert device.enable_energy_usage_requests == False
 
     await coordinator.async_shutdown()
+
+
+async def test_energy_sensor_decodes_once_per_refresh(
+    hass: HomeAssistant
+) -> None:
+    """Test AC device energy sensors read decoded values published by the coordinator."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    device._online = True
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    sensor = MideaEnergySensor(
+        coordinator,
+        "real_time_power_usage",
+        SensorDeviceClass.POWER,
+        UnitOfPower.WATT,
+        "real_time_power_usage",
+        format=AC.EnergyDataFormat.BINARY,
+        scale=2.0,
+    )
+
+    # Listen to the sensor's property like the entity would once added to HA
+    unsubscribe = coordinator.async_add_listener(
+        MagicMock(), frozenset({"real_time_power_usage"}))
+
+    with (patch.object(device, "refresh"),
+          patch.object(device, "get_real_time_power_usage", return_value=100) as getter_mock):
+        await coordinator.async_refresh()
+        getter_mock.reset_mock()
+
+        # Verify availability and state don't decode energy data
+        with patch.object(coordinator, "published_value",
+                          wraps=coordinator.published_value) as published_mock:
+            assert coordinator.available
+            assert sensor.available
+            assert sensor.native_value == 200
+            assert sensor.native_value == 200
+            getter_mock.assert_not_called()
+
+            # Verify the value is memoized until the next refresh
+            published_mock.assert_called_once()
+
+        # Verify a refresh decodes each format once
+        await coordinator.async_refresh()
+        assert getter_mock.call_count == len(AC.EnergyDataFormat)
+
+        # Verify availability is cached until the next refresh
+        device._online = False
+        assert sensor.available
+        await coordinator.async_refresh()
+        assert not coordinator.available
+        assert not sensor.available
+
+    unsubscribe()
+    await coordinator.async_shutdown()
+
+
+async def test_circuit_breaker_sensor(
+    hass: HomeAssistant
+) -> None:
+    """Test the circuit breaker sensor stays available and follows the breaker state."""
+
+    # Create a dummy device and coordinator
+    device = AC("0.0.0.0", 0, 0)
+    coordinator = MideaDeviceUpdateCoordinator(hass, device)
+
+    sensor = MideaCircuitBreakerSensor(coordinator)
+    assert sensor.native_value == CircuitState.CLOSED
+
+    # Listen to breaker changes like the entity would once added to HA
+    listener = MagicMock()
+    remove_listener = coordinator.async_add_circuit_listener(listener)
+
+    with patch.object(device, "refresh"):
+        # Verify the breaker opening is published while the device is unavailable
+        for _ in range(3):
+            await coordinator._async_update_data()
+        listener.assert_called_once()
+        assert not coordinator.available
+        assert sensor.available
+        assert sensor.native_value == CircuitState.OPEN
+        assert sensor.extra_state_attributes["failures"] == 3
+
+        # Verify the probe and the recovery are published
+        coordinator._circuit_breaker._retry_at = 0
+        device._online = True
+        await coordinator._async_update_data()
+        assert listener.call_count == 3
+        assert sensor.native_value == CircuitState.CLOSED
+
+    remove_listener()
+    await coordinator.async_shutdown()